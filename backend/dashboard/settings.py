@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 import os
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -102,12 +103,43 @@ DATABASES = {
         'PORT': config('DB_PORT', default='5432'),
         'CONN_MAX_AGE': 600,  # Keep connections alive for 10 minutes
         'CONN_HEALTH_CHECKS': True,  # Validate connections before use
+        # Requests run in autocommit; writes open their own transaction.atomic()
+        # blocks so a request only holds a transaction while it is writing
+        'ATOMIC_REQUESTS': False,
         'OPTIONS': {
             'connect_timeout': 10,  # Reduced timeout for faster failure detection
         }
     }
 }
 
+# Behind pgBouncer in transaction pooling mode (pool_mode = transaction) a
+# backend is only ours for the duration of a transaction: server-side cursors
+# (QuerySet.iterator()) cannot span statements and persistent connections only
+# pin pooler slots, so leave pooling to pgBouncer
+DB_TRANSACTION_POOLING = config('DB_TRANSACTION_POOLING', default=False, cast=bool)
+if DB_TRANSACTION_POOLING:
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+
+# Cache. Set CACHE_REDIS_URL to share the cache between web processes (and the
+# Celery worker); without it each process keeps its own local-memory cache, so
+# an invalidation only reaches the process that issued it
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default='')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -153,6 +185,34 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 11000  # Set a higher limit (default is 1000)
 
+# Payroll bulk write-back: use django-fast-update (UPDATE ... FROM VALUES)
+# instead of bulk_update's CASE WHEN statements. Disable to fall back.
+PAYROLL_FAST_UPDATE = config('PAYROLL_FAST_UPDATE', default=True, cast=bool)
+PAYROLL_FAST_UPDATE_BATCH_SIZE = config('PAYROLL_FAST_UPDATE_BATCH_SIZE', default=10000, cast=int)
+
+# Celery (background jobs). Only used when CELERY_ENABLED is set, i.e. a
+# broker and worker are actually deployed (there is none on Vercel); then
+# payroll saves with more entries than PAYROLL_ASYNC_THRESHOLD are handed to a
+# worker and polled via /jobs/<id>/. Workers invalidate cache entries the web
+# processes read, so they require the shared CACHE_REDIS_URL cache.
+CELERY_ENABLED = config('CELERY_ENABLED', default=False, cast=bool)
+if CELERY_ENABLED and not CACHE_REDIS_URL:
+    raise ImproperlyConfigured('CELERY_ENABLED requires CACHE_REDIS_URL so workers share the web cache')
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default=CELERY_BROKER_URL)
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_BROKER_CONNECTION_TIMEOUT = config('CELERY_BROKER_CONNECTION_TIMEOUT', default=2, cast=int)
+# Long summary/payroll jobs should not sit prefetched behind each other on one worker
+CELERY_WORKER_PREFETCH_MULTIPLIER = config('CELERY_WORKER_PREFETCH_MULTIPLIER', default=1, cast=int)
+PAYROLL_ASYNC_THRESHOLD = config('PAYROLL_ASYNC_THRESHOLD', default=500, cast=int)
+
+# Keys per Redis UNLINK command when purging tenant cache families
+CACHE_UNLINK_CHUNK_SIZE = config('CACHE_UNLINK_CHUNK_SIZE', default=128, cast=int)
+
+# Rows per INSERT for monthly attendance uploads
+ATTENDANCE_BULK_BATCH_SIZE = config('ATTENDANCE_BULK_BATCH_SIZE', default=500, cast=int)
+
 
 # CORS Configuration
 # Allow override via environment variable for development
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('excel_data', '0026_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='advanceledger',
+            index=models.Index(fields=['tenant', 'employee_id', 'status', 'advance_date'], name='advance_payroll_date_idx'),
+        ),
+    ]
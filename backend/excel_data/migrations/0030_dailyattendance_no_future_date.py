@@ -0,0 +1,33 @@
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('excel_data', '0029_emp_active_dept_idx'),
+    ]
+
+    operations = [
+        # Added NOT VALID so only new writes are checked: existing future-dated rows
+        # (e.g. pre-entered leave) are left for an operator to review, then
+        # VALIDATE CONSTRAINT can be run once they are resolved
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    """
+                    ALTER TABLE excel_data_dailyattendance
+                    ADD CONSTRAINT dailyattendance_no_future_date
+                    CHECK (date <= STATEMENT_TIMESTAMP()) NOT VALID;
+                    """,
+                    reverse_sql="ALTER TABLE excel_data_dailyattendance DROP CONSTRAINT IF EXISTS dailyattendance_no_future_date;",
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='dailyattendance',
+                    constraint=models.CheckConstraint(condition=models.Q(('date__lte', django.db.models.functions.datetime.Now())), name='dailyattendance_no_future_date'),
+                ),
+            ],
+        ),
+    ]
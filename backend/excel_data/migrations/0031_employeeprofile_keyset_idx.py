@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('excel_data', '0030_dailyattendance_no_future_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employeeprofile',
+            index=models.Index(fields=['tenant', 'is_active', 'employee_id'], name='emp_active_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('excel_data', '0031_employeeprofile_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employeeprofile',
+            name='off_days_mask',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Cast(
+                    django.db.models.functions.comparison.Cast('off_monday', models.IntegerField()) * 1
+                    + django.db.models.functions.comparison.Cast('off_tuesday', models.IntegerField()) * 2
+                    + django.db.models.functions.comparison.Cast('off_wednesday', models.IntegerField()) * 4
+                    + django.db.models.functions.comparison.Cast('off_thursday', models.IntegerField()) * 8
+                    + django.db.models.functions.comparison.Cast('off_friday', models.IntegerField()) * 16
+                    + django.db.models.functions.comparison.Cast('off_saturday', models.IntegerField()) * 32
+                    + django.db.models.functions.comparison.Cast('off_sunday', models.IntegerField()) * 64,
+                    models.SmallIntegerField(),
+                ),
+                output_field=models.SmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='employeeprofile',
+            index=models.Index(fields=['tenant', 'is_active', 'off_days_mask'], name='emp_active_offdays_idx'),
+        ),
+    ]
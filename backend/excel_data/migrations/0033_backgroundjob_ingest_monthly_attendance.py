@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('excel_data', '0032_employeeprofile_off_days_mask'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='backgroundjob',
+            name='job_type',
+            field=models.CharField(choices=[('SAVE_PAYROLL_PERIOD', 'Save Payroll Period'), ('INGEST_MONTHLY_ATTENDANCE', 'Ingest Monthly Attendance')], max_length=50),
+        ),
+    ]
@@ -13,6 +13,7 @@ This package contains models used by the excel_data app.    'Tenant',
 from .tenant import (
     Tenant,
     TenantAwareManager,
+    TenantAwareFastUpdateManager,
     TenantAwareModel,
 )
 
@@ -67,11 +68,17 @@ from .ledger import (
     Payment,
 )
 
+# Background Job Models
+from .jobs import (
+    BackgroundJob,
+)
+
 # Define all models to be imported via 'from excel_data.models import *'
 __all__ = [
     # Tenant Models
     'Tenant',
     'TenantAwareManager',
+    'TenantAwareFastUpdateManager',
     'TenantAwareModel',
     
     # Auth Models
@@ -105,4 +112,7 @@ __all__ = [
     # Ledger Models
     'AdvanceLedger',
     'Payment',
+    
+    # Background Job Models
+    'BackgroundJob',
 ]
\ No newline at end of file
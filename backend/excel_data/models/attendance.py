@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Now
 from django.utils import timezone
 from datetime import datetime, date, time
 from .tenant import TenantAwareModel
@@ -25,6 +27,9 @@ class Attendance(TenantAwareModel):
         ordering = ['-date', 'name']
         # Ensure we don't have duplicate entries for the same employee on the same date
         unique_together = ['tenant', 'employee_id', 'date']
+        indexes = [
+            models.Index(fields=['tenant', 'date'], name='monthly_att_tenant_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.date}"
@@ -79,6 +84,10 @@ class DailyAttendance(TenantAwareModel):
             models.Index(fields=['tenant', 'date'], name='attendance_date_idx'),
             models.Index(fields=['employee_id', 'attendance_status'], name='attendance_status_idx'),
         ]
+        constraints = [
+            # Attendance cannot be recorded for future dates
+            models.CheckConstraint(condition=Q(date__lte=Now()), name='dailyattendance_no_future_date'),
+        ]
 
     def save(self, *args, **kwargs):
         # Calculate working hours if both check_in and check_out are present
@@ -1,6 +1,21 @@
 from django.db import models
+from django.db.models.functions import Cast
 from .tenant import TenantAwareModel
 
+OFF_DAY_FIELDS = (
+    'off_monday', 'off_tuesday', 'off_wednesday', 'off_thursday',
+    'off_friday', 'off_saturday', 'off_sunday',
+)
+
+
+def _off_days_mask_expression():
+    # Bit n is set when the employee is off on weekday n (Monday = 0)
+    expression = None
+    for bit, field in enumerate(OFF_DAY_FIELDS):
+        term = Cast(field, models.IntegerField()) * (1 << bit)
+        expression = term if expression is None else expression + term
+    return Cast(expression, models.SmallIntegerField())
+
 
 class EmployeeProfile(TenantAwareModel):
     # Personal Information
@@ -57,6 +72,13 @@ class EmployeeProfile(TenantAwareModel):
     off_friday = models.BooleanField(default=False)
     off_saturday = models.BooleanField(default=False)
     off_sunday = models.BooleanField(default=True)  # Sunday is commonly off
+    # Maintained by PostgreSQL from the seven flags above; lets "off on weekday n"
+    # be a single bit test on one column
+    off_days_mask = models.GeneratedField(
+        expression=_off_days_mask_expression(),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
     
     # System fields
     employee_id = models.CharField(max_length=50, blank=True, null=True)
@@ -73,6 +95,9 @@ class EmployeeProfile(TenantAwareModel):
             models.Index(fields=['tenant', 'is_active'], name='employee_active_idx'),
             models.Index(fields=['tenant', 'employee_id'], name='employee_id_idx'),
             models.Index(fields=['is_active', 'employee_id'], name='employee_lookup_idx'),
+            models.Index(fields=['tenant', 'is_active', 'department'], name='emp_active_dept_idx'),
+            models.Index(fields=['tenant', 'is_active', 'employee_id'], name='emp_active_keyset_idx'),
+            models.Index(fields=['tenant', 'is_active', 'off_days_mask'], name='emp_active_offdays_idx'),
         ]
 
     def save(self, *args, **kwargs):
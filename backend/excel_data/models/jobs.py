@@ -0,0 +1,32 @@
+from django.db import models
+from .tenant import TenantAwareModel
+
+
+class BackgroundJob(TenantAwareModel):
+    """
+    Tracks work offloaded to Celery so the frontend can poll for its outcome
+    """
+    class JobType(models.TextChoices):
+        SAVE_PAYROLL_PERIOD = 'SAVE_PAYROLL_PERIOD', 'Save Payroll Period'
+        INGEST_MONTHLY_ATTENDANCE = 'INGEST_MONTHLY_ATTENDANCE', 'Ingest Monthly Attendance'
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        SUCCESS = 'SUCCESS', 'Success'
+        FAILED = 'FAILED', 'Failed'
+
+    job_type = models.CharField(max_length=50, choices=JobType.choices)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+
+    class Meta:
+        app_label = 'excel_data'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['tenant', 'status'], name='bgjob_tenant_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type} #{self.pk} - {self.status}"
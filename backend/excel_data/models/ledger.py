@@ -1,5 +1,5 @@
 from django.db import models
-from .tenant import TenantAwareModel
+from .tenant import TenantAwareModel, TenantAwareFastUpdateManager
 
 
 class AdvanceLedger(TenantAwareModel):
@@ -24,6 +24,8 @@ class AdvanceLedger(TenantAwareModel):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
     remarks = models.TextField(blank=True, null=True)
 
+    objects = TenantAwareFastUpdateManager()
+
     def save(self, *args, **kwargs):
         # Set remaining_balance to amount if not set (for new records)
         if self.remaining_balance == 0 and self.amount > 0 and not self.pk:
@@ -40,6 +42,8 @@ class AdvanceLedger(TenantAwareModel):
         db_table = 'excel_data_advanceledger'
         indexes = [
             models.Index(fields=['tenant', 'employee_id', 'status'], name='advance_payroll_idx'),
+            # Ordered fetch of open advances (oldest first) when applying payroll deductions
+            models.Index(fields=['tenant', 'employee_id', 'status', 'advance_date'], name='advance_payroll_date_idx'),
             models.Index(fields=['tenant', 'for_month'], name='advance_month_idx'),
             models.Index(fields=['employee_id', 'status'], name='advance_status_idx'),
         ]
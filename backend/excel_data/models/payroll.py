@@ -1,6 +1,6 @@
 from django.db import models
 from decimal import Decimal
-from .tenant import TenantAwareModel
+from .tenant import TenantAwareModel, TenantAwareFastUpdateManager
 
 
 class DataSource(models.TextChoices):
@@ -84,6 +84,8 @@ class CalculatedSalary(TenantAwareModel):
     is_paid = models.BooleanField(default=False)
     payment_date = models.DateField(null=True, blank=True)
     
+    objects = TenantAwareFastUpdateManager()
+    
     class Meta:
         app_label = 'excel_data'
         unique_together = ['tenant', 'payroll_period', 'employee_id']
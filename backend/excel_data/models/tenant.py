@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
+from fast_update.query import FastUpdateQuerySet
 from ..utils.utils import get_current_tenant
 
 
@@ -53,6 +54,14 @@ class TenantAwareManager(models.Manager):
         return super().get_queryset()
 
 
+class TenantAwareFastUpdateManager(TenantAwareManager.from_queryset(FastUpdateQuerySet)):
+    """
+    Tenant-aware manager that also exposes fast_update() / copy_update()
+    for large write-backs (UPDATE ... FROM VALUES instead of CASE WHEN)
+    """
+    pass
+
+
 class TenantAwareModel(models.Model):
     """
     Abstract base model that automatically adds tenant to all models
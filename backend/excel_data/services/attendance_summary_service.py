@@ -0,0 +1,73 @@
+"""
+Monthly attendance summary maintenance
+
+Rebuilds MonthlyAttendanceSummary rows from DailyAttendance for a set of
+employees after bulk attendance changes, using one aggregate query and one
+batched upsert.
+"""
+
+from django.db import transaction
+from django.db.models import Count, Sum, Q
+from ..models import DailyAttendance, MonthlyAttendanceSummary
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_monthly_summaries(tenant, year, month, employee_ids):
+    """
+    Recompute the month's summary for each employee (employees without any
+    attendance rows get a zeroed summary). Returns the number of summaries written.
+    """
+    unique_employee_ids = list(set(employee_ids))
+    if not unique_employee_ids:
+        return 0
+    
+    # Aggregate every employee's month in a single query
+    daily_aggregations = DailyAttendance.objects.filter(
+        tenant=tenant,
+        employee_id__in=unique_employee_ids,
+        date__year=year,
+        date__month=month
+    ).values('employee_id').annotate(
+        full_days=Count('id', filter=Q(attendance_status__in=['PRESENT', 'PAID_LEAVE'])),
+        half_days=Count('id', filter=Q(attendance_status='HALF_DAY')),
+        total_ot_hours=Sum('ot_hours'),
+        total_late_minutes=Sum('late_minutes'),
+    )
+    daily_lookup = {agg['employee_id']: agg for agg in daily_aggregations}
+    
+    summaries = []
+    for employee_id in unique_employee_ids:
+        daily_data = daily_lookup.get(employee_id)
+        if daily_data:
+            # Present counts: PRESENT and PAID_LEAVE count as 1, HALF_DAY as 0.5
+            present_days = daily_data['full_days'] + daily_data['half_days'] * 0.5
+            ot_hours = daily_data['total_ot_hours'] or 0
+            late_minutes = daily_data['total_late_minutes'] or 0
+        else:
+            present_days = 0
+            ot_hours = 0
+            late_minutes = 0
+        
+        summaries.append(MonthlyAttendanceSummary(
+            tenant=tenant,
+            employee_id=employee_id,
+            year=year,
+            month=month,
+            present_days=present_days,
+            ot_hours=ot_hours,
+            late_minutes=late_minutes,
+        ))
+    
+    with transaction.atomic():
+        MonthlyAttendanceSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['tenant', 'employee_id', 'year', 'month'],
+            update_fields=['present_days', 'ot_hours', 'late_minutes', 'last_updated'],
+            batch_size=500,
+        )
+    
+    logger.info("Refreshed %s monthly attendance summaries for tenant %s (%s-%02d)", len(summaries), tenant.id, year, month)
+    return len(summaries)
@@ -0,0 +1,177 @@
+"""
+Monthly attendance ingestion
+
+Validates a monthly attendance upload column-wise with pandas and loads it
+into Attendance, through COPY on PostgreSQL and batched bulk_create elsewhere.
+Runs inside the Celery worker for uploads queued by the API.
+"""
+
+import io
+from django.conf import settings
+from django.db import transaction, connection
+from django.utils import timezone
+from ..models import Attendance
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Value used for each optional column when a record omits it or it fails to parse
+RECORD_DEFAULTS = {
+    'department': '',
+    'total_working_days': 0,
+    'present_days': 0,
+    'absent_days': 0,
+    'ot_hours': 0,
+    'late_minutes': 0,
+}
+RECORD_COLUMNS = ['employee_id', 'name', *RECORD_DEFAULTS]
+NUMERIC_COLUMNS = ['total_working_days', 'present_days', 'absent_days', 'ot_hours', 'late_minutes']
+INTEGER_COLUMNS = ['total_working_days', 'present_days', 'absent_days', 'late_minutes']
+MAX_REPORTED_ERRORS = 10
+# Columns refreshed when a re-uploaded record matches an existing (tenant, employee_id, date)
+UPDATE_FIELDS = [
+    'name', 'department', 'calendar_days', 'total_working_days', 'present_days',
+    'absent_days', 'ot_hours', 'late_minutes', 'updated_at',
+]
+
+
+def ingest_monthly_attendance(tenant_id, attendance_date, data):
+    """
+    Upsert one Attendance row per valid record for the month starting at
+    attendance_date, so a corrected re-upload overwrites the month in place.
+    Returns the created/updated/failed counts and the first validation errors.
+    Takes the raw tenant id so callers never need to load the Tenant row.
+    """
+    import pandas as pd
+    
+    # Validate and coerce whole columns at once instead of per record
+    df = pd.DataFrame(data).reindex(columns=RECORD_COLUMNS)
+    required = (
+        df['employee_id'].notna() & (df['employee_id'] != '')
+        & df['name'].notna() & (df['name'] != '')
+    )
+    # Only the first few errors are reported, so only those are formatted
+    invalid_positions = (~required).to_numpy().nonzero()[0]
+    failed = len(invalid_positions)
+    errors = ['Record {}: Missing employee_id or name'.format(position + 1) for position in invalid_positions[:MAX_REPORTED_ERRORS]]
+    
+    df = df[required].copy()
+    df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    df = df.fillna(RECORD_DEFAULTS)
+    df[INTEGER_COLUMNS] = df[INTEGER_COLUMNS].astype(int)
+    # Every row shares the month's date, so a repeated employee id would hit the
+    # same row twice in one upsert (which PostgreSQL rejects); the last one wins
+    df = df.drop_duplicates(subset='employee_id', keep='last')
+    total = len(df)
+    created = updated = 0
+    
+    if total and connection.vendor == 'postgresql':
+        # Stream the rows through COPY into a temporary staging table, then
+        # upsert them with ON CONFLICT DO UPDATE (COPY itself cannot resolve
+        # rows that already exist for the tenant/employee/date)
+        copy_columns = [
+            'tenant_id', 'employee_id', 'name', 'department', 'date', 'calendar_days',
+            'total_working_days', 'present_days', 'absent_days', 'ot_hours', 'late_minutes',
+            'created_at', 'updated_at'
+        ]
+        now = timezone.now().isoformat()
+        df = df.assign(
+            tenant_id=tenant_id,
+            date=attendance_date.isoformat(),
+            calendar_days=30,  # Default for month
+            created_at=now,
+            updated_at=now
+        )
+        buffer = io.StringIO()
+        df[copy_columns].to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+    
+        table = connection.ops.quote_name(Attendance._meta.db_table)
+        column_list = ', '.join(copy_columns)
+        copy_sql = (
+            f"COPY attendance_upload_staging ({column_list}) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NOT_NULL (department))"
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE attendance_upload_staging ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {table} WITH NO DATA"
+            )
+            if hasattr(cursor.cursor, 'copy_expert'):
+                cursor.cursor.copy_expert(copy_sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.cursor.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            update_list = ', '.join(f"{field} = EXCLUDED.{field}" for field in UPDATE_FIELDS)
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT {column_list} FROM attendance_upload_staging "
+                # Arbitrated by the unique (tenant, employee_id, date) index
+                f"ON CONFLICT (tenant_id, employee_id, date) DO UPDATE SET {update_list} "
+                # xmax is 0 only for freshly inserted row versions
+                f"RETURNING (xmax = 0)"
+            )
+            inserted_flags = [inserted for (inserted,) in cursor.fetchall()]
+        created = sum(inserted_flags)
+        updated = len(inserted_flags) - created
+    elif total:
+        attendance_records = [
+            Attendance(
+                tenant_id=tenant_id,
+                employee_id=employee_id,
+                name=name,
+                department=department,
+                date=attendance_date,
+                calendar_days=30,  # Default for month
+                total_working_days=int(total_working_days),
+                present_days=int(present_days),
+                absent_days=int(absent_days),
+                ot_hours=float(ot_hours),
+                late_minutes=int(late_minutes)
+            )
+            # Plain tuples in RECORD_COLUMNS order (no namedtuple per row)
+            for (employee_id, name, department, total_working_days, present_days,
+                 absent_days, ot_hours, late_minutes) in df[RECORD_COLUMNS].itertuples(index=False, name=None)
+        ]
+        # Existing rows are only looked up to report created vs updated counts
+        updated = Attendance.objects.filter(
+            tenant_id=tenant_id,
+            date=attendance_date,
+            employee_id__in=df['employee_id'].tolist()
+        ).count()
+        created = total - updated
+        
+        # Bulk upsert in right-sized INSERTs (one unbounded statement can exceed
+        # the backend's bind parameter limit); all batches commit together
+        if connection.features.supports_update_conflicts_with_target:
+            conflict_options = {
+                'update_conflicts': True,
+                'unique_fields': ['tenant', 'employee_id', 'date'],
+                'update_fields': UPDATE_FIELDS,
+            }
+        else:
+            # Backend cannot upsert: existing rows are left untouched
+            conflict_options = {'ignore_conflicts': True}
+            updated = 0
+        with transaction.atomic():
+            Attendance.objects.bulk_create(
+                attendance_records,
+                batch_size=settings.ATTENDANCE_BULK_BATCH_SIZE,
+                **conflict_options
+            )
+    
+    logger.info("Ingested monthly attendance for tenant %s: %s created, %s updated, %s failed", tenant_id, created, updated, failed)
+    if failed:
+        # One aggregated record per upload, however many rows were rejected
+        logger.warning(
+            "monthly_attendance_upload: %d/%d rows failed for tenant=%s month=%s year=%s",
+            failed, len(data), tenant_id, attendance_date.month, attendance_date.year,
+            extra={'sample_errors': errors[:5]}
+        )
+    return {
+        'created': created,
+        'updated': updated,
+        'failed': failed,
+        'errors': errors,
+    }
@@ -6,6 +6,7 @@ providing a unified calculation engine with admin controls for advance deduction
 """
 
 from datetime import date, timedelta
+from itertools import islice
 from decimal import Decimal
 from django.db import transaction
 from django.db.models import Sum
@@ -17,6 +18,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT when bulk-creating calculated salaries
+BULK_BATCH_SIZE = 1000
+
 class SalaryCalculationService:
     """
     Service class for autonomous salary calculations
@@ -575,4 +579,79 @@ class SalaryCalculationService:
             'pending_count': calculated_salaries.filter(is_paid=False).count(),
         }
         
-        return summary 
\ No newline at end of file
+        return summary 
+    
+    @staticmethod
+    def save_payroll_entries(tenant, payroll_period, payroll_entries):
+        """
+        Replace a period's calculated salaries with the provided entries as-is
+        (no recalculation). Returns the number of saved entries.
+        """
+        from .cache_service import bump_payroll_cache
+        
+        def build_salaries():
+            for entry in payroll_entries:
+                get = entry.get
+                base_gross = get('gross_salary', 0)
+                ot_charges = get('ot_charges', 0)
+                late_deduction = get('late_deduction', 0)
+                tds_amount = get('tds_amount', 0)
+                
+                # Compute derived totals once per entry
+                gross = base_gross + ot_charges - late_deduction
+                after_tds = gross - tds_amount
+                
+                # Fields left at their model defaults (incentive, OT rate, editable
+                # flag, data source) are not passed explicitly; the per-hour/minute
+                # rates have no default, so they are zeroed here
+                yield CalculatedSalary(
+                    tenant=tenant,
+                    payroll_period=payroll_period,
+                    employee_id=get('employee_id'),
+                    employee_name=get('employee_name'),
+                    department=get('department'),
+                    basic_salary=get('base_salary', 0),
+                    basic_salary_per_hour=0,
+                    basic_salary_per_minute=0,
+                    employee_tds_rate=get('tds_percentage', 0),
+                    total_working_days=get('working_days', 0),
+                    present_days=get('present_days', 0),
+                    absent_days=get('absent_days', 0),
+                    ot_hours=get('ot_hours', 0),
+                    late_minutes=get('late_minutes', 0),
+                    salary_for_present_days=base_gross,
+                    ot_charges=ot_charges,
+                    late_deduction=late_deduction,
+                    gross_salary=gross,
+                    tds_amount=tds_amount,
+                    salary_after_tds=after_tds,
+                    total_advance_balance=get('total_advance_balance', 0),
+                    advance_deduction_amount=get('advance_deduction', 0),
+                    remaining_advance_balance=get('remaining_balance', 0),
+                    net_payable=get('net_salary', 0),
+                    is_paid=get('is_paid', False),
+                )
+        
+        saved_count = 0
+        
+        # Replace the period's salaries in one transaction so batched INSERTs commit together
+        with transaction.atomic():
+            CalculatedSalary.objects.filter(
+                tenant=tenant,
+                payroll_period=payroll_period
+            ).delete()
+            # bulk_create materialises its input, so feed it one window of lazily
+            # built instances at a time to keep only BULK_BATCH_SIZE in memory
+            salaries = build_salaries()
+            while True:
+                batch = list(islice(salaries, BULK_BATCH_SIZE))
+                if not batch:
+                    break
+                CalculatedSalary.objects.bulk_create(batch)
+                saved_count += len(batch)
+        
+        # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
+        bump_payroll_cache(tenant.id)
+        logger.info("Cleared payroll overview cache for tenant %s", tenant.id)
+        
+        return saved_count
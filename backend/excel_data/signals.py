@@ -4,6 +4,7 @@ from .models import DailyAttendance, Attendance, AdvanceLedger, Payment, SalaryD
 from django.db.models import Sum
 from datetime import date
 from decimal import Decimal
+from .services.cache_service import invalidate_dropdown_options_cache
 
 @receiver([post_save, post_delete], sender=DailyAttendance)
 def sync_attendance_from_daily(sender, instance, **kwargs):
@@ -94,4 +95,10 @@ def update_monthly_attendance_summary(sender, instance, **kwargs):
     except Exception as exc:
         # Soft-fail – we don't want attendance updates to break
         import logging
-        logging.getLogger(__name__).error(f"Failed to update MonthlyAttendanceSummary: {exc}") 
\ No newline at end of file
+        logging.getLogger(__name__).error(f"Failed to update MonthlyAttendanceSummary: {exc}") 
+
+
+@receiver([post_save, post_delete], sender=EmployeeProfile)
+def invalidate_dropdown_options(sender, instance, **kwargs):
+    """Drop cached signup dropdown values when an employee changes."""
+    invalidate_dropdown_options_cache(instance.tenant_id)
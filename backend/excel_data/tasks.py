@@ -0,0 +1,107 @@
+"""
+Celery tasks for the excel_data app
+"""
+
+import logging
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def save_payroll_period_task(job_id, tenant_id, period_id, payroll_entries):
+    """
+    Save a payroll period's entries outside the request cycle and record the
+    outcome on the BackgroundJob polled by the frontend
+    """
+    from .models import BackgroundJob, PayrollPeriod
+    from .services.salary_service import SalaryCalculationService
+
+    job = BackgroundJob.all_objects.get(id=job_id, tenant_id=tenant_id)
+    job.status = BackgroundJob.Status.RUNNING
+    job.save(update_fields=['status', 'updated_at'])
+
+    try:
+        payroll_period = PayrollPeriod.all_objects.select_related('tenant').get(id=period_id, tenant_id=tenant_id)
+        saved_count = SalaryCalculationService.save_payroll_entries(
+            payroll_period.tenant, payroll_period, payroll_entries
+        )
+    except Exception as e:
+        logger.error("Payroll save job %s failed: %s", job_id, e)
+        job.status = BackgroundJob.Status.FAILED
+        job.error = str(e)
+        job.save(update_fields=['status', 'error', 'updated_at'])
+        raise
+
+    job.status = BackgroundJob.Status.SUCCESS
+    job.result = {
+        'payroll_period_id': payroll_period.id,
+        'saved_entries': saved_count,
+    }
+    job.save(update_fields=['status', 'result', 'updated_at'])
+    logger.info("Payroll save job %s saved %s entries for %s %s", job_id, saved_count, payroll_period.month, payroll_period.year)
+    return saved_count
+
+
+@shared_task
+def ingest_monthly_attendance_task(job_id, tenant_id, date_str, data):
+    """
+    Load a monthly attendance upload outside the request cycle and record the
+    outcome on the BackgroundJob polled by the frontend
+    """
+    from datetime import date
+    from .models import BackgroundJob
+    from .services.attendance_upload_service import ingest_monthly_attendance
+
+    job = BackgroundJob.all_objects.get(id=job_id, tenant_id=tenant_id)
+    job.status = BackgroundJob.Status.RUNNING
+    job.save(update_fields=['status', 'updated_at'])
+
+    try:
+        result = ingest_monthly_attendance(tenant_id, date.fromisoformat(date_str), data)
+    except Exception as e:
+        logger.error("Monthly attendance job %s failed: %s", job_id, e)
+        job.status = BackgroundJob.Status.FAILED
+        job.error = str(e)
+        job.save(update_fields=['status', 'error', 'updated_at'])
+        raise
+
+    job.status = BackgroundJob.Status.SUCCESS
+    job.result = {
+        'total_records': len(data),
+        **result,
+    }
+    job.save(update_fields=['status', 'result', 'updated_at'])
+    return result['created']
+
+
+@shared_task
+def invalidate_attendance_caches_task(tenant_id, date_str, employee_ids):
+    """
+    Clear attendance-related caches after a daily attendance upload commits
+    """
+    from .services.cache_service import invalidate_attendance_caches
+
+    return invalidate_attendance_caches(tenant_id, date_str, employee_ids)
+
+
+@shared_task
+def refresh_monthly_summaries_task(tenant_id, date_str, employee_ids):
+    """
+    Rebuild the monthly attendance summaries touched by an attendance upload,
+    then drop the caches that read them
+    """
+    from .models import Tenant
+    from .services.attendance_summary_service import refresh_monthly_summaries
+    from .services.cache_service import dashboard_stats_cache_key, purge_tenant_caches
+
+    tenant = Tenant.objects.get(id=tenant_id)
+    year, month = int(date_str[:4]), int(date_str[5:7])
+    updated = refresh_monthly_summaries(tenant, year, month, employee_ids)
+    purge_tenant_caches(tenant_id, [
+        f"monthly_attendance_summary_{tenant_id}_{year}_{month}",
+        f"monthly_attendance_summary_{tenant_id}",
+        f"attendance_tracker_{tenant_id}",
+        dashboard_stats_cache_key(tenant_id),
+    ], namespaces=('payroll', 'attendance'))
+    return updated
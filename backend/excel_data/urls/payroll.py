@@ -6,7 +6,7 @@ from ..views import (
     get_months_with_attendance, calculate_simple_payroll, calculate_simple_payroll_ultra_fast,
     update_payroll_entry, mark_payroll_paid, payroll_overview, create_current_month_payroll,
     payroll_period_detail, add_employee_advance, auto_payroll_settings, manual_calculate_payroll,
-    save_payroll_period_direct, bulk_update_payroll_period
+    save_payroll_period_direct, bulk_update_payroll_period, job_status
 )
 
 urlpatterns = [
@@ -40,4 +40,7 @@ urlpatterns = [
 
     # Bulk update payroll period endpoint
     path('payroll-periods/<int:period_id>/bulk-update/', bulk_update_payroll_period, name='bulk-update-payroll-period'),
+
+    # Background job status polling
+    path('jobs/<int:job_id>/', job_status, name='job-status'),
 ]
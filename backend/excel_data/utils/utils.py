@@ -1,4 +1,5 @@
 import threading
+from decimal import Decimal
 import pandas as pd
 import numpy as np
 
@@ -203,6 +204,18 @@ def clean_int_value(value):
     except (ValueError, TypeError, OverflowError):
         return 0
 
+def to_decimal(value, _Decimal=Decimal):
+    """
+    Convert a payload value to Decimal, skipping the str() round-trip for
+    values that are already Decimal or int. Raises InvalidOperation on bad input.
+    """
+    value_type = type(value)
+    if value_type is _Decimal:
+        return value
+    if value_type is int:
+        return _Decimal(value)
+    return _Decimal(str(value))
+
 def is_valid_name(name):
     """
     Check if a name is valid (not empty, not just '-', not '0', etc.)
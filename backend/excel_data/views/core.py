@@ -43,6 +43,14 @@ from ..serializers import (
     PaymentSerializer,
 
 )
+from ..services.cache_service import (
+    bump_payroll_cache,
+    bump_attendance_cache,
+    get_attendance_cache_version,
+    set_tenant_cache,
+    dashboard_stats_cache_key,
+    invalidate_dropdown_options_cache,
+)
 class SalaryDataViewSet(viewsets.ModelViewSet):
 
     """
@@ -762,7 +770,10 @@ class SalaryDataViewSet(viewsets.ModelViewSet):
                     'original_query_time_ms': query_timings['total_time_ms'],
                     'cache_source': 'computed'
                 }
-                cache.set(cache_key, cache_response, 900)  # 15 minutes
+                if tenant:
+                    set_tenant_cache(tenant.id, cache_key, cache_response, 900)  # 15 minutes
+                else:
+                    cache.set(cache_key, cache_response, 900)  # 15 minutes
                 query_timings['cache_store_ms'] = round((time.time() - cache_store_start) * 1000, 2)
                 logger.info(f"Frontend charts cache stored for key: {cache_key} - Original time: {query_timings['total_time_ms']}ms")
             except Exception as e:
@@ -837,8 +848,7 @@ class EmployeeProfileViewSet(viewsets.ModelViewSet):
         from django.core.cache import cache
         tenant = getattr(self.request, 'tenant', None)
         if tenant:
-            payroll_cache_key = f"payroll_overview_{tenant.id}"
-            cache.delete(payroll_cache_key)
+            bump_payroll_cache(tenant.id)
             logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
 
 
@@ -872,7 +882,7 @@ class EmployeeProfileViewSet(viewsets.ModelViewSet):
         page_size = min(int(request.GET.get('page_size', 100)), 500)
         
         cache_signature = f"load_all_{load_all}_page_{page}_size_{page_size}"
-        cache_key = f"directory_data_{tenant.id}_{cache_signature}"
+        cache_key = f"directory_data_{tenant.id}_v{get_attendance_cache_version(tenant.id)}_{cache_signature}"
         timing_breakdown['setup_ms'] = round((time.time() - step_start) * 1000, 2)
         
         # STEP 2: Cache check
@@ -1107,9 +1117,9 @@ class EmployeeProfileViewSet(viewsets.ModelViewSet):
         # Cache based on data size and load_all parameter
         if use_cache:
             if load_all and total_count <= 1000:  # Cache load_all for reasonable sizes
-                cache.set(cache_key, response_data, 600)  # 10 minutes for load_all
+                set_tenant_cache(tenant.id, cache_key, response_data, 600)  # 10 minutes for load_all
             elif not load_all and len(data) <= 100:  # Cache paginated responses
-                cache.set(cache_key, response_data, 300)   # 5 minutes for pagination
+                set_tenant_cache(tenant.id, cache_key, response_data, 300)   # 5 minutes for pagination
         timing_breakdown['cache_save_ms'] = round((time.time() - step_start) * 1000, 2)
         
         # Performance logging
@@ -1199,19 +1209,13 @@ class EmployeeProfileViewSet(viewsets.ModelViewSet):
         from django.core.cache import cache
         tenant = getattr(request, 'tenant', None)
         
-        # Clear directory data cache
-        cache_key = f"directory_data_{tenant.id if tenant else 'default'}"
-        cache.delete(cache_key)
+        # Clear directory data and daily attendance all_records caches (versioned)
+        bump_attendance_cache(tenant.id if tenant else 'default')
         
         # Clear payroll overview cache
-        payroll_cache_key = f"payroll_overview_{tenant.id if tenant else 'default'}"
-        cache.delete(payroll_cache_key)
+        bump_payroll_cache(tenant.id if tenant else 'default')
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id if tenant else 'default'}")
-        
-        # Clear daily attendance all_records cache
-        attendance_records_cache_key = f"attendance_all_records_{tenant.id if tenant else 'default'}"
-        cache.delete(attendance_records_cache_key)
-        logger.info(f"Cleared attendance all_records cache for tenant {tenant.id if tenant else 'default'}")
+        logger.info(f"Cleared directory data and attendance all_records caches for tenant {tenant.id if tenant else 'default'}")
         
         return Response({
             'message': f'Employee {employee.full_name} is now {"active" if employee.is_active else "inactive"}',
@@ -1512,13 +1516,11 @@ class EmployeeProfileViewSet(viewsets.ModelViewSet):
             
             # Clear relevant caches
             from django.core.cache import cache
-            cache_keys = [
-                f"directory_data_{tenant.id}",
-                f"payroll_overview_{tenant.id}",
-                f"attendance_all_records_{tenant.id}"
-            ]
-            for key in cache_keys:
-                cache.delete(key)
+            cache.delete(dashboard_stats_cache_key(tenant.id))
+            # bulk_create skips the post_save signal that clears this
+            invalidate_dropdown_options_cache(tenant.id)
+            bump_payroll_cache(tenant.id)
+            bump_attendance_cache(tenant.id)
             
             return Response({
                 'message': 'Bulk upload completed successfully!',
@@ -1948,7 +1950,7 @@ class DailyAttendanceViewSet(viewsets.ModelViewSet):
         # Build cache key that is aware of the selected parameters so that each
         # combination is cached independently.
         param_signature = f"{time_period}_{month_param}_{year_param}_{start_date_str}_{end_date_str}"
-        cache_key       = f"attendance_all_records_{tenant.id}_{param_signature}"
+        cache_key       = f"attendance_all_records_{tenant.id}_v{get_attendance_cache_version(tenant.id)}_{param_signature}"
         timing_breakdown['params_extraction_ms'] = round((time.time() - step_start) * 1000, 2)
 
         step_start = time.time()
@@ -2052,7 +2054,7 @@ class DailyAttendanceViewSet(viewsets.ModelViewSet):
             employees_dict = {emp['employee_id']: emp for emp in employees_qs}
             
             # Cache for 15 minutes (employees don't change frequently)
-            cache.set(employee_cache_key, employees_dict, 900)
+            set_tenant_cache(tenant.id, employee_cache_key, employees_dict, 900)
             timing_breakdown['employee_fetch_cache_miss'] = True
         else:
             timing_breakdown['employee_fetch_cache_hit'] = True
@@ -2260,7 +2262,7 @@ class DailyAttendanceViewSet(viewsets.ModelViewSet):
         # --------------------------------------------------
         step_start = time.time()
         if use_cache:
-            cache.set(cache_key, response_data, 300)
+            set_tenant_cache(tenant.id, cache_key, response_data, 300)
         timing_breakdown['cache_save_ms'] = round((time.time() - step_start) * 1000, 2)
 
         # Add total processing time after all optimizations
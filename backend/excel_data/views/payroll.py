@@ -23,19 +23,23 @@
 # - manual_calculate_payroll
 # - save_payroll_period_direct
 # - bulk_update_payroll_period
+# - job_status
 
 
 from rest_framework.response import Response
 from rest_framework import status, viewsets, filters
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
+from drf_orjson_renderer.renderers import ORJSONRenderer
 from ..models import EmployeeProfile
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
+from collections import defaultdict
 import time
 from django.db.models import Q
 from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
-from django.db import transaction
+from django.db import transaction, connection
+from django.conf import settings
 import logging
 
 # Initialize logger
@@ -56,6 +60,8 @@ from rest_framework import serializers
 
 # Email verification views will be defined in this file
 from ..services.salary_service import SalaryCalculationService
+from ..services.cache_service import bump_payroll_cache, payroll_overview_cache_key
+from ..utils.utils import to_decimal
 
 
 
@@ -206,9 +212,7 @@ def calculate_payroll(request):
                 tenant, year, month, force_recalculate
             )
         # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -241,9 +245,7 @@ def calculate_payroll(request):
             message = f'Payroll calculation completed for {payroll_period.month} {payroll_period.year}'
         
         # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -293,9 +295,7 @@ def update_advance_deduction(request):
         )
         
         # CLEAR CACHE: Invalidate payroll overview cache when advance deduction changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -325,9 +325,7 @@ def lock_payroll_period(request, period_id):
         
         payroll_period = SalaryCalculationService.lock_payroll_period(tenant, period_id)
         # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -484,8 +482,7 @@ def mark_salary_paid(request):
         
         
         # CLEAR CACHE: Invalidate payroll overview cache when payment status changes
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         logger.info(f"Bulk marked {updated_count} salaries as paid for tenant {tenant.name}")
@@ -735,7 +732,7 @@ def payroll_overview(request):
         
         # Check for cache bypass
         no_cache = request.GET.get('no_cache', 'false').lower() == 'true'
-        cache_key = f"payroll_overview_{tenant.id}"
+        cache_key = payroll_overview_cache_key(tenant.id)
         
         # Try to get from cache first (unless bypassed)
         if not no_cache:
@@ -1072,9 +1069,7 @@ def add_employee_advance(request):
         
         
         # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -1239,9 +1234,7 @@ class AdvancePaymentViewSet(viewsets.ModelViewSet):
             advance = serializer.save(tenant=tenant)
             
             # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-            from django.core.cache import cache
-            cache_key = f"payroll_overview_{tenant.id}"
-            cache.delete(cache_key)
+            bump_payroll_cache(tenant.id)
             logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
             
             return Response({
@@ -1272,9 +1265,7 @@ class AdvancePaymentViewSet(viewsets.ModelViewSet):
             serializer.save()
             
             # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-            from django.core.cache import cache
-            cache_key = f"payroll_overview_{getattr(self.request, 'tenant', None).id}"
-            cache.delete(cache_key)
+            bump_payroll_cache(getattr(self.request, 'tenant', None).id)
             logger.info(f"Cleared payroll overview cache for tenant {getattr(self.request, 'tenant', None).id}")
             
             return Response({
@@ -1738,8 +1729,7 @@ def mark_payroll_paid(request):
         
         # CLEAR CACHE: Invalidate payroll overview cache when payment status changes
         from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         # Also clear frontend charts cache so dashboard reloads fresh KPIs immediately
@@ -1830,9 +1820,7 @@ def manual_calculate_payroll(request):
             tenant, year, month, force_recalculate=True
         )
         # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
+        bump_payroll_cache(tenant.id)
         logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
         
         return Response({
@@ -2087,6 +2075,7 @@ def calculate_simple_payroll_ultra_fast(request):
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def save_payroll_period_direct(request):
     """
     Save payroll period directly with the provided data (no recalculation)
@@ -2135,74 +2124,174 @@ def save_payroll_period_direct(request):
             }
         )
         
-        # Delete existing calculated salaries for this period (to replace with new data)
-        CalculatedSalary.objects.filter(
-            tenant=tenant,
-            payroll_period=payroll_period
-        ).delete()
-        
-        # Create new calculated salary records directly from the provided data
-        calculated_salaries = []
-        for entry in payroll_entries:
-            calculated_salary = CalculatedSalary(
+        # Large payrolls are saved by a Celery worker (when one is deployed);
+        # the client polls the job
+        if settings.CELERY_ENABLED and len(payroll_entries) > settings.PAYROLL_ASYNC_THRESHOLD:
+            from ..models import BackgroundJob
+            from ..tasks import save_payroll_period_task
+            
+            job = BackgroundJob.objects.create(
                 tenant=tenant,
-                payroll_period=payroll_period,
-                employee_id=entry.get('employee_id'),
-                employee_name=entry.get('employee_name'),
-                department=entry.get('department'),
-                basic_salary=entry.get('base_salary', 0),
-                basic_salary_per_hour=0,  # Can be calculated if needed
-                basic_salary_per_minute=0,  # Can be calculated if needed
-                employee_ot_rate=0,  # Set from employee profile if needed
-                employee_tds_rate=entry.get('tds_percentage', 0),
-                total_working_days=entry.get('working_days', 0),
-                present_days=entry.get('present_days', 0),
-                absent_days=entry.get('absent_days', 0),
-                ot_hours=entry.get('ot_hours', 0),
-                late_minutes=entry.get('late_minutes', 0),
-                salary_for_present_days=entry.get('gross_salary', 0),
-                ot_charges=entry.get('ot_charges', 0),
-                late_deduction=entry.get('late_deduction', 0),
-                incentive=0,  # Add if needed
-                gross_salary=entry.get('gross_salary', 0) + entry.get('ot_charges', 0) - entry.get('late_deduction', 0),
-                tds_amount=entry.get('tds_amount', 0),
-                salary_after_tds=entry.get('gross_salary', 0) + entry.get('ot_charges', 0) - entry.get('late_deduction', 0) - entry.get('tds_amount', 0),
-                total_advance_balance=entry.get('total_advance_balance', 0),
-                advance_deduction_amount=entry.get('advance_deduction', 0),
-                advance_deduction_editable=True,
-                remaining_advance_balance=entry.get('remaining_balance', 0),
-                net_payable=entry.get('net_salary', 0),
-                data_source='FRONTEND',
-                is_paid=entry.get('is_paid', False),
+                job_type=BackgroundJob.JobType.SAVE_PAYROLL_PERIOD,
             )
-            calculated_salaries.append(calculated_salary)
+            try:
+                save_payroll_period_task.delay(job.id, tenant.id, payroll_period.id, payroll_entries)
+            except Exception as e:
+                # Broker unavailable - fall back to saving within the request
+                logger.warning("Could not queue payroll save job %s, saving synchronously: %s", job.id, e)
+                job.delete()
+            else:
+                logger.info("Queued payroll save job %s for %s %s with %s entries", job.id, month_name, year, len(payroll_entries))
+                return Response({
+                    'success': True,
+                    'message': f'Payroll period save queued for {month_name} {year}',
+                    'job_id': job.id,
+                    'status': job.status,
+                    'payroll_period_id': payroll_period.id,
+                    'created_new_period': created,
+                }, status=status.HTTP_202_ACCEPTED)
         
-        # Bulk create all calculated salary records
-        CalculatedSalary.objects.bulk_create(calculated_salaries)
+        saved_count = SalaryCalculationService.save_payroll_entries(tenant, payroll_period, payroll_entries)
         
-        # CLEAR CACHE: Invalidate payroll overview cache when payroll data changes
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
-        logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
-        
-        logger.info(f"Saved payroll period {month_name} {year} with {len(calculated_salaries)} entries directly")
+        logger.info("Saved payroll period %s %s with %s entries directly", month_name, year, saved_count)
         
         return Response({
             'success': True,
             'message': f'Payroll period saved successfully for {month_name} {year}',
             'payroll_period_id': payroll_period.id,
-            'saved_entries': len(calculated_salaries),
+            'saved_entries': saved_count,
             'created_new_period': created,
             'cache_cleared': True
         })
         
     except Exception as e:
-        logger.error(f"Error in save_payroll_period_direct: {str(e)}")
+        logger.error("Error in save_payroll_period_direct: %s", e)
         return Response({"error": f"Failed to save payroll period: {str(e)}"}, status=500)
 
+def _bulk_write_back(model, objs, fields):
+    """
+    Write changed rows back in bulk. Uses fast_update (UPDATE ... FROM VALUES)
+    when PAYROLL_FAST_UPDATE is enabled, otherwise Django's bulk_update.
+    """
+    if getattr(settings, 'PAYROLL_FAST_UPDATE', False):
+        return model.objects.fast_update(
+            objs, fields, batch_size=settings.PAYROLL_FAST_UPDATE_BATCH_SIZE
+        )
+    return model.objects.bulk_update(objs, fields, batch_size=100)
+
+def _apply_advance_deductions_sql(tenant_id, deductions):
+    """
+    Apply per-employee advance deductions to the oldest open advances in a
+    single UPDATE (PostgreSQL). A running window sum over each employee's
+    open advances decides how much of the deduction every advance absorbs.
+    Returns (repaid_count, partially_paid_count).
+    """
+    # Lock the open advances first so concurrent payroll updates for the same
+    # employees serialise here instead of computing from a stale snapshot
+    list(
+        AdvanceLedger.objects.select_for_update().filter(
+            tenant_id=tenant_id,
+            employee_id__in=list(deductions.keys()),
+            status__in=['PENDING', 'PARTIALLY_PAID']
+        ).values_list('id', flat=True)
+    )
+
+    values_sql = ", ".join(["(%s, %s::numeric)"] * len(deductions))
+    params = []
+    for employee_id, amount in deductions.items():
+        params.extend([employee_id, to_decimal(amount)])
+    params.append(tenant_id)
+
+    table = AdvanceLedger._meta.db_table
+    sql = f"""
+        WITH deductions (employee_id, deduction) AS (VALUES {values_sql}),
+        ordered AS (
+            SELECT a.id, a.remaining_balance, d.deduction,
+                   COALESCE(SUM(a.remaining_balance) OVER (
+                       PARTITION BY a.employee_id ORDER BY a.advance_date, a.id
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                   ), 0) AS prev_running
+            FROM {table} a
+            JOIN deductions d ON d.employee_id = a.employee_id
+            WHERE a.tenant_id = %s AND a.status IN ('PENDING', 'PARTIALLY_PAID')
+        ),
+        applied AS (
+            SELECT id, GREATEST(remaining_balance - (deduction - prev_running), 0) AS new_balance
+            FROM ordered
+            WHERE deduction > prev_running
+        )
+        UPDATE {table} AS l
+        SET remaining_balance = applied.new_balance,
+            status = CASE WHEN applied.new_balance = 0 THEN 'REPAID' ELSE 'PARTIALLY_PAID' END
+        FROM applied
+        WHERE l.id = applied.id
+        RETURNING l.status
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        statuses = [row[0] for row in cursor.fetchall()]
+
+    repaid_count = statuses.count('REPAID')
+    return repaid_count, len(statuses) - repaid_count
+
+def _apply_advance_deductions_python(tenant_id, deductions):
+    """
+    Python fallback of _apply_advance_deductions_sql for non-PostgreSQL databases.
+    Returns (repaid_count, partially_paid_count).
+    """
+    # Get all relevant advance records in one query
+    all_employee_ids = list(deductions.keys())
+    # select_for_update: the caller runs inside transaction.atomic(), so these rows
+    # stay locked until the write-back commits (no lost deductions under concurrency)
+    all_advances = AdvanceLedger.objects.select_for_update().filter(
+        tenant_id=tenant_id,
+        employee_id__in=all_employee_ids,
+        status__in=['PENDING','PARTIALLY_PAID']
+    ).only(
+        'id', 'employee_id', 'advance_date', 'remaining_balance', 'status'
+    ).order_by('employee_id', 'advance_date')
+
+    # Group advances by employee for efficient processing
+    advances_by_employee = defaultdict(list)
+    for advance in all_advances:
+        advances_by_employee[advance.employee_id].append(advance)
+
+    # Process advance deductions for each employee
+    advances_to_update = []
+    advances_to_mark_repaid = []
+
+    for employee_id, total_deduction in deductions.items():
+        remaining_deduction = to_decimal(total_deduction)
+        employee_advances = advances_by_employee.get(employee_id, [])
+
+        for advance in employee_advances:
+            if remaining_deduction <= 0:
+                break
+
+            current_balance = advance.remaining_balance
+            if current_balance <= remaining_deduction:
+                # This advance is fully paid
+                advance.status = 'REPAID'
+                advance.remaining_balance = Decimal('0')
+                advances_to_mark_repaid.append(advance)
+                remaining_deduction -= current_balance
+            else:
+                # This advance is partially paid - reduce the remaining_balance
+                advance.remaining_balance -= remaining_deduction
+                advance.status = 'PARTIALLY_PAID'
+                advances_to_update.append(advance)
+                remaining_deduction = Decimal('0')
+
+    # Execute a single bulk update for advance ledger (both lists write the same columns)
+    advances_changed = advances_to_update + advances_to_mark_repaid
+    if advances_changed:
+        _bulk_write_back(AdvanceLedger, advances_changed, ['remaining_balance', 'status'])
+
+    return len(advances_to_mark_repaid), len(advances_to_update)
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def bulk_update_payroll_period(request, period_id):
     """
     Bulk-update payment status and advance deductions for all
@@ -2224,21 +2313,25 @@ def bulk_update_payroll_period(request, period_id):
 
         # Validate that the period exists and belongs to this tenant
         try:
-            payroll_period = PayrollPeriod.objects.get(id=period_id, tenant=tenant)
+            payroll_period = PayrollPeriod.objects.select_related('tenant').get(id=period_id, tenant_id=tenant.id)
         except PayrollPeriod.DoesNotExist:
             return Response({"error": "Payroll period not found"}, status=404)
 
-        # Fetch all salaries for the period in one query
-        employee_ids = [e.get("employee_id") for e in entries if e.get("employee_id")]
+        # Fetch all salaries for the period in one query. employee_id is a CharField,
+        # so ids sent as numbers are normalised to str once for the query and lookups
+        employee_ids = list({str(e["employee_id"]) for e in entries if e.get("employee_id")})
         if not employee_ids:
             return Response({"error": "No valid employee IDs provided"}, status=400)
 
         salary_map = {
             s.employee_id: s for s in
             CalculatedSalary.objects.filter(
-                tenant=tenant, 
+                tenant_id=tenant.id,
                 payroll_period_id=period_id,
                 employee_id__in=employee_ids
+            ).only(
+                'id', 'employee_id', 'is_paid', 'payment_date',
+                'advance_deduction_amount', 'salary_after_tds', 'net_payable'
             )
         }
 
@@ -2248,111 +2341,91 @@ def bulk_update_payroll_period(request, period_id):
         # Process updates
         salaries_to_update = []
         advance_deductions_processed = {}
+        valid_entries = 0
+        # Salary bands and deduction amounts repeat across employees, so reuse
+        # the computed net payable for identical (salary_after_tds, deduction) pairs
+        net_payable_cache = {}
+        today = timezone.now().date()
         
         for entry in entries:
             employee_id = entry.get("employee_id")
             if not employee_id:
                 continue
+            employee_id = str(employee_id)
                 
             salary = salary_map.get(employee_id)
             if not salary:
-                logger.warning(f"Salary not found for employee {employee_id} in period {period_id}")
+                logger.warning("Salary not found for employee %s in period %s", employee_id, period_id)
                 continue
 
+            # Only rows whose values actually change are written back
+            dirty = False
+
             # Update payment status
             if "is_paid" in entry:
-                salary.is_paid = bool(entry["is_paid"])
-                salary.payment_date = timezone.now().date() if salary.is_paid else None
+                is_paid = bool(entry["is_paid"])
+                if is_paid != salary.is_paid:
+                    salary.is_paid = is_paid
+                    salary.payment_date = today if is_paid else None
+                    dirty = True
 
             # Update advance deduction amount
             if "advance_deduction_amount" in entry:
                 try:
-                    new_amount = Decimal(str(entry["advance_deduction_amount"]))
-                    salary.advance_deduction_amount = new_amount
-                    
-                    # Recalculate net payable
-                    salary.net_payable = salary.salary_after_tds - new_amount
+                    new_amount = to_decimal(entry["advance_deduction_amount"])
+                    if new_amount != salary.advance_deduction_amount:
+                        salary.advance_deduction_amount = new_amount
+                        
+                        # Recalculate net payable
+                        net_key = (salary.salary_after_tds, new_amount)
+                        net_payable = net_payable_cache.get(net_key)
+                        if net_payable is None:
+                            net_payable = net_payable_cache[net_key] = salary.salary_after_tds - new_amount
+                        salary.net_payable = net_payable
+                        dirty = True
                     
                     # Track advance deduction change for ledger updates
                     if salary.is_paid and new_amount > 0:
                         advance_deductions_processed[employee_id] = new_amount
                         
                 except (ValueError, TypeError, InvalidOperation):
-                    logger.error(f"Invalid advance_deduction_amount for employee {employee_id}: {entry.get('advance_deduction_amount')}")
+                    logger.error("Invalid advance_deduction_amount for employee %s: %s", employee_id, entry.get('advance_deduction_amount'))
                     continue
 
-            salaries_to_update.append(salary)
+            valid_entries += 1
+            if dirty:
+                salaries_to_update.append(salary)
 
-        if not salaries_to_update:
+        if not valid_entries:
             return Response({"error": "No valid updates to process"}, status=400)
 
         # Perform bulk update
         with transaction.atomic():
-            CalculatedSalary.objects.bulk_update(
-                salaries_to_update,
-                ['is_paid', 'payment_date', 'advance_deduction_amount', 'net_payable'],
-                batch_size=100
-            )
+            if salaries_to_update:
+                _bulk_write_back(
+                    CalculatedSalary,
+                    salaries_to_update,
+                    ['is_paid', 'payment_date', 'advance_deduction_amount', 'net_payable']
+                )
 
             # Process advance ledger updates for paid salaries (similar to mark_salary_paid logic)
             if advance_deductions_processed:
-                logger.info(f"Processing advance deductions for {len(advance_deductions_processed)} employees")
+                logger.info("Processing advance deductions for %s employees", len(advance_deductions_processed))
                 
-                # Get all relevant advance records in one query
-                all_employee_ids = list(advance_deductions_processed.keys())
-                all_advances = AdvanceLedger.objects.filter(
-                    tenant=tenant,
-                    employee_id__in=all_employee_ids,
-                    status__in=['PENDING','PARTIALLY_PAID']
-                ).order_by('employee_id', 'advance_date')
-
-                # Group advances by employee for efficient processing
-                advances_by_employee = {}
-                for advance in all_advances:
-                    if advance.employee_id not in advances_by_employee:
-                        advances_by_employee[advance.employee_id] = []
-                    advances_by_employee[advance.employee_id].append(advance)
-
-                # Process advance deductions for each employee
-                advances_to_update = []
-                advances_to_mark_repaid = []
-
-                for employee_id, total_deduction in advance_deductions_processed.items():
-                    remaining_deduction = Decimal(str(total_deduction))
-                    employee_advances = advances_by_employee.get(employee_id, [])
-
-                    for advance in employee_advances:
-                        if remaining_deduction <= 0:
-                            break
-
-                        current_balance = advance.remaining_balance
-                        if current_balance <= remaining_deduction:
-                            # This advance is fully paid
-                            advance.status = 'REPAID'
-                            advance.remaining_balance = Decimal('0')
-                            advances_to_mark_repaid.append(advance)
-                            remaining_deduction -= current_balance
-                        else:
-                            # This advance is partially paid - reduce the remaining_balance
-                            advance.remaining_balance -= remaining_deduction
-                            advance.status = 'PARTIALLY_PAID'
-                            advances_to_update.append(advance)
-                            remaining_deduction = Decimal('0')
-
-                # Execute bulk updates for advance ledger
-                if advances_to_update:
-                    AdvanceLedger.objects.bulk_update(advances_to_update, ['remaining_balance', 'status'], batch_size=100)
-                    logger.info(f"Bulk updated {len(advances_to_update)} advance remaining balances")
-
-                if advances_to_mark_repaid:
-                    AdvanceLedger.objects.bulk_update(advances_to_mark_repaid, ['status', 'remaining_balance'], batch_size=100)
-                    logger.info(f"Marked {len(advances_to_mark_repaid)} advances as repaid")
+                if connection.vendor == 'postgresql':
+                    repaid_count, partial_count = _apply_advance_deductions_sql(
+                        tenant.id, advance_deductions_processed
+                    )
+                else:
+                    repaid_count, partial_count = _apply_advance_deductions_python(
+                        tenant.id, advance_deductions_processed
+                    )
+                logger.info("Bulk updated %s advance remaining balances", partial_count)
+                logger.info("Marked %s advances as repaid", repaid_count)
 
         # Clear payroll overview cache
-        from django.core.cache import cache
-        cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(cache_key)
-        logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
+        bump_payroll_cache(tenant.id)
+        logger.info("Cleared payroll overview cache for tenant %s", tenant.id)
 
         return Response({
             "success": True,
@@ -2363,5 +2436,38 @@ def bulk_update_payroll_period(request, period_id):
         })
 
     except Exception as e:
-        logger.error(f"Error in bulk_update_payroll_period: {str(e)}")
+        logger.error("Error in bulk_update_payroll_period: %s", e)
         return Response({"error": f"Bulk update failed: {str(e)}"}, status=500)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def job_status(request, job_id):
+    """
+    Poll the status of a background job (e.g. a queued payroll save)
+    """
+    try:
+        tenant = getattr(request, 'tenant', None)
+        if not tenant:
+            return Response({"error": "No tenant found"}, status=400)
+        
+        from ..models import BackgroundJob
+        
+        try:
+            job = BackgroundJob.objects.get(id=job_id, tenant=tenant)
+        except BackgroundJob.DoesNotExist:
+            return Response({"error": "Job not found"}, status=404)
+        
+        return Response({
+            'job_id': job.id,
+            'job_type': job.job_type,
+            'status': job.status,
+            'result': job.result,
+            'error': job.error or None,
+            'created_at': job.created_at,
+            'updated_at': job.updated_at,
+        })
+        
+    except Exception as e:
+        logger.error("Error in job_status: %s", e)
+        return Response({"error": f"Failed to fetch job status: {str(e)}"}, status=500)
@@ -14,12 +14,29 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
+from drf_orjson_renderer.renderers import ORJSONRenderer
 from ..models import EmployeeProfile
-from django.db.models import Q, Sum, Count
+from ..models.employee import OFF_DAY_FIELDS
+from django.db.models import (
+    Q, Sum, Count, F, Func, Value, CharField, OuterRef, Subquery, Case, When,
+)
+from django.db.models.functions import Coalesce, Concat, NullIf
 from django.utils import timezone
+from django.db import transaction
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from itertools import islice
+from datetime import datetime, date, timedelta
+from urllib.parse import quote
+from django.conf import settings
+from django.http import HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from wsgiref.util import FileWrapper
+import hashlib
 import logging
+import os
+import orjson
+import tempfile
+import threading
 import time
 
 from ..models import (
@@ -39,6 +56,7 @@ from ..models import (
     SalaryAdjustment,
     DataSource,
     MonthlyAttendanceSummary,
+    BackgroundJob,
 )
 
 from ..serializers import (
@@ -71,10 +89,32 @@ from ..utils.utils import (
 )
 
 from ..services.salary_service import SalaryCalculationService
+from ..services.attendance_upload_service import ingest_monthly_attendance
+from ..services.attendance_summary_service import refresh_monthly_summaries
+from ..services.cache_service import (
+    bump_payroll_cache,
+    bump_attendance_cache,
+    get_attendance_cache_version,
+    invalidate_attendance_caches,
+    purge_tenant_caches,
+    set_tenant_cache,
+    dashboard_stats_cache_key,
+    DASHBOARD_STATS_CACHE_TIMEOUT,
+    dropdown_options_cache_key,
+    DROPDOWN_OPTIONS_CACHE_TIMEOUT,
+)
+from django.core.cache import cache
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+MONTH_ABBR = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
+MONTH_NAMES = (
+    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE',
+    'JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
+)
+
 @api_view(["GET"])
 def dashboard_stats(request):
     """
@@ -91,7 +131,16 @@ def dashboard_stats(request):
 
     current_date = timezone.now()
 
-    current_month = current_date.strftime("%B").upper()[:3]
+    tenant = getattr(request, 'tenant', None)
+    cache_key = dashboard_stats_cache_key(tenant.id, current_date.year, current_date.month) if tenant else None
+    if cache_key:
+        cached_stats = cache.get(cache_key)
+        if cached_stats is not None:
+            return Response(cached_stats)
+
+    current_month_name = MONTH_NAMES[current_date.month - 1]
+
+    current_month = MONTH_ABBR[current_date.month - 1]
 
     current_year = current_date.year
 
@@ -101,33 +150,51 @@ def dashboard_stats(request):
 
     # Current month salary data
 
-    current_month_data = SalaryData.objects.filter(
-        year=current_year, month__icontains=current_month
+    # Months are stored either abbreviated or in full; match both exactly
+    # instead of a substring scan
+    # Totals and breakdowns in a single aggregate query (FILTER clauses on
+    # PostgreSQL) instead of one query per figure
+    current_month_totals = SalaryData.objects.filter(
+        Q(month__iexact=current_month) | Q(month__iexact=current_month_name),
+        year=current_year,
+    ).aggregate(
+        total=Sum("nett_payable"),
+        paid=Count("id"),
+        with_ot=Count("id", filter=Q(ot__gt=0)),
+        ot_charges=Sum("charges", filter=Q(charges__gt=0)),
     )
 
-    total_salary_paid = (
-        current_month_data.aggregate(Sum("nett_payable"))["nett_payable__sum"] or 0
-    )
+    total_salary_paid = current_month_totals["total"] or 0
 
-    employees_paid = current_month_data.count()
+    employees_paid = current_month_totals["paid"] or 0
+
+    employees_with_ot = current_month_totals["with_ot"] or 0
+
+    total_ot_charges = current_month_totals["ot_charges"] or 0
 
     # Department distribution
 
-    dept_distribution = (
-        EmployeeProfile.objects.values("department")
+    dept_distribution = list(
+        EmployeeProfile.objects.filter(is_active=True)
+        .values("department")
         .annotate(count=Count("id"))
         .order_by("department")
     )
 
-    return Response(
-        {
-            "total_employees": total_employees,
-            "employees_paid_this_month": employees_paid,
-            "total_salary_paid": float(total_salary_paid),
-            "department_distribution": list(dept_distribution),
-            "current_month": f"{current_month} {current_year}",
-        }
-    )
+    stats = {
+        "total_employees": total_employees,
+        "employees_paid_this_month": employees_paid,
+        "total_salary_paid": float(total_salary_paid),
+        "employees_with_ot_this_month": employees_with_ot,
+        "total_ot_charges": float(total_ot_charges),
+        "department_distribution": dept_distribution,
+        "current_month": f"{current_month} {current_year}",
+    }
+
+    if cache_key:
+        cache.set(cache_key, stats, DASHBOARD_STATS_CACHE_TIMEOUT)
+
+    return Response(stats)
 
 
 @api_view(["POST"])
@@ -191,57 +258,51 @@ def get_dropdown_options(request):
     Get unique values for all dropdowns for the public signup page.
     """
     try:
-        # Get all unique, non-empty departments from all employees
-        departments_clean = set(
-            EmployeeProfile.objects.exclude(department__isnull=True)
-            .exclude(department='')
-            .values_list('department', flat=True)
-            .distinct()
-        )
-        
-        # Get all unique, non-empty location branches
-        locations_clean = set(
-            EmployeeProfile.objects.exclude(location_branch__isnull=True)
-            .exclude(location_branch='')
-            .values_list('location_branch', flat=True)
-            .distinct()
-        )
-        
-        # Get all unique, non-empty designations
-        designations_clean = set(
-            EmployeeProfile.objects.exclude(designation__isnull=True)
-            .exclude(designation='')
-            .values_list('designation', flat=True)
-            .distinct()
-        )
-
-        # Get all unique, non-empty cities
-        cities_clean = set(
-            EmployeeProfile.objects.exclude(city__isnull=True)
-            .exclude(city='')
-            .values_list('city', flat=True)
-            .distinct()
-        )
-
-        # Get all unique, non-empty states
-        states_clean = set(
-            EmployeeProfile.objects.exclude(state__isnull=True)
-            .exclude(state='')
-            .values_list('state', flat=True)
-            .distinct()
-        )
-        
-        return Response({
+        # The employee queryset below is scoped to the request's tenant, so the
+        # cached options are keyed by it
+        tenant = getattr(request, 'tenant', None)
+        cache_key = dropdown_options_cache_key(tenant.id if tenant else None)
+        cached_options = cache.get(cache_key)
+        if cached_options is not None:
+            return Response(cached_options)
+        
+        # Collect all unique, non-empty dropdown values in a single pass over employees
+        departments_clean = set()
+        locations_clean = set()
+        designations_clean = set()
+        cities_clean = set()
+        states_clean = set()
+        
+        rows = EmployeeProfile.objects.values_list(
+            'department', 'location_branch', 'designation', 'city', 'state'
+        ).iterator(chunk_size=2000)
+        
+        for department, location, designation, city, state in rows:
+            if department:
+                departments_clean.add(department)
+            if location:
+                locations_clean.add(location)
+            if designation:
+                designations_clean.add(designation)
+            if city:
+                cities_clean.add(city)
+            if state:
+                states_clean.add(state)
+        
+        options = {
             'departments': sorted(list(departments_clean)),
             'locations': sorted(list(locations_clean)),
             'designations': sorted(list(designations_clean)),
             'cities': sorted(list(cities_clean)),
             'states': sorted(list(states_clean))
-        })
+        }
+        cache.set(cache_key, options, DROPDOWN_OPTIONS_CACHE_TIMEOUT)
+        
+        return Response(options)
         
     except Exception as e:
         # Log the error for debugging
-        print(f"Error in get_dropdown_options: {str(e)}")
+        logger.exception("Error in get_dropdown_options")
         return Response({"error": "An unexpected error occurred while fetching options."}, status=500)
 
 
@@ -271,8 +332,6 @@ def attendance_status(request):
     Get attendance tracking status and information
     """
     try:
-        from datetime import datetime, date
-        
         tenant = getattr(request, 'tenant', None)
         if not tenant:
             return Response({"error": "No tenant found"}, status=400)
@@ -284,18 +343,26 @@ def attendance_status(request):
         # Check if attendance tracking is active
         is_active = current_date >= attendance_start_date
         
+        # Current month as a date range so the (tenant, date) index is used
+        # instead of EXTRACT on every row
+        month_start = current_date.replace(day=1)
+        next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+        
+        # Sequential queries on the request's connection: each is an indexed
+        # lookup, cheaper than opening a connection per worker thread
         # Get total active employees
         total_active_employees = EmployeeProfile.objects.filter(
             tenant=tenant,
             is_active=True
         ).count()
         
-        # Get employees with attendance records this month
+        # Get employees with attendance records this month (distinct employees,
+        # not rows, so several entries for one employee count once)
         employees_with_records = Attendance.objects.filter(
             tenant=tenant,
-            date__year=current_date.year,
-            date__month=current_date.month
-        ).count()
+            date__gte=month_start,
+            date__lt=next_month_start
+        ).values('employee_id').distinct().count()
         
         # Check if we have day-by-day attendance data (DailyAttendance records)
         has_daily_tracking = DailyAttendance.objects.filter(
@@ -305,8 +372,8 @@ def attendance_status(request):
         
         return Response({
             'is_active': is_active,
-            'start_date': attendance_start_date.strftime('%Y-%m-%d'),
-            'current_date': current_date.strftime('%Y-%m-%d'),
+            'start_date': attendance_start_date.isoformat(),
+            'current_date': current_date.isoformat(),
             'total_active_employees': total_active_employees,
             'employees_with_records': employees_with_records,
             'has_daily_tracking': has_daily_tracking,
@@ -315,9 +382,10 @@ def attendance_status(request):
         })
         
     except Exception as e:
-        logger.error(f"Error getting attendance status: {str(e)}")
+        logger.error("Error getting attendance status: %s", e)
         return Response({"error": "Failed to get attendance status"}, status=500)
 
+@transaction.non_atomic_requests
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def bulk_update_attendance(request):
@@ -325,9 +393,6 @@ def bulk_update_attendance(request):
     Optimized bulk update attendance with batch processing for better performance
     """
     try:
-        from datetime import datetime
-        from django.db import transaction
-        
         tenant = getattr(request, 'tenant', None)
         if not tenant:
             return Response({"error": "No tenant found"}, status=400)
@@ -343,7 +408,7 @@ def bulk_update_attendance(request):
         
         # Parse the date
         try:
-            attendance_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            attendance_date = date.fromisoformat(date_str)
         except ValueError:
             return Response({"error": "Invalid date format. Use YYYY-MM-DD"}, status=400)
         
@@ -354,294 +419,211 @@ def bulk_update_attendance(request):
         # Get day of week for off-day checks
         day_of_week = attendance_date.weekday()  # Monday = 0, Sunday = 6
         
-        # Extract all employee IDs from attendance records
-        employee_ids = [record.get('employee_id') for record in attendance_records if record.get('employee_id')]
-        
-        if not employee_ids:
+        # Check that the payload references at least one employee
+        if not any(record.get('employee_id') for record in attendance_records):
             return Response({"error": "No valid employee IDs found"}, status=400)
         
-        # Bulk fetch all employees in one query
-        employees = EmployeeProfile.objects.filter(
-            tenant=tenant,
-            employee_id__in=employee_ids,
-            is_active=True
-        ).select_related()  # Optimize related queries
-        
-        # Create employee lookup dictionary for fast access
-        employee_lookup = {emp.employee_id: emp for emp in employees}
-        
-        # Get existing attendance records for this date to determine updates vs creates
-        existing_attendance = DailyAttendance.objects.filter(
-            tenant=tenant,
-            employee_id__in=employee_ids,
-            date=attendance_date
-        )
-        existing_lookup = {att.employee_id: att for att in existing_attendance}
+        # The date is fixed for the whole upload, so only that weekday's off flag matters
+        off_field = OFF_DAY_FIELDS[day_of_week]
         
-        # Prepare batch data
-        records_to_create = []
-        records_to_update = []
         created_count = 0
         updated_count = 0
         skipped_count = 0
         errors = []
+        affected_employee_ids = set()
         
         # PERFORMANCE OPTIMIZATION: Add timing and batch size optimization
-        import time
         processing_start_time = time.time()
         cache_clear_time = 0  # Initialize cache_clear_time variable
+        processing_time = 0
+        db_operation_time = 0
         
-        # Process records in batch with performance tracking
-        batch_size = 500  # Reduced from processing all at once
+        # Process records in chunks so lookups and pending rows stay bounded in
+        # memory; each chunk is written in its own short transaction
+        batch_size = 500
         processed_batches = 0
         
-        for record in attendance_records:
-            try:
-                employee_id = record.get('employee_id')
-                if not employee_id:
-                    errors.append(f"Missing employee_id in record")
-                    continue
-                
-                # Check if employee exists (using lookup dictionary)
-                employee = employee_lookup.get(employee_id)
-                if not employee:
-                    errors.append(f"Employee {employee_id} not found or inactive")
-                    continue
-                
-                # Check if employee has joined by this date
-                if employee.date_of_joining and attendance_date < employee.date_of_joining:
-                    skipped_count += 1
-                    continue
-                
-                # OPTIMIZED: Use pre-calculated off day check
-                off_day_flags = [
-                    employee.off_monday, employee.off_tuesday, employee.off_wednesday,
-                    employee.off_thursday, employee.off_friday, employee.off_saturday, employee.off_sunday
-                ]
-                
-                if off_day_flags[day_of_week]:
-                    skipped_count += 1
-                    continue  # Skip attendance for off days
-                
-                # OPTIMIZED: Minimal data processing
-                ot_hours = float(record.get('ot_hours', 0))
-                late_minutes = int(record.get('late_minutes', 0))
-                employee_name = record.get('name') or f"{employee.first_name} {employee.last_name}"
-                department = record.get('department') or employee.department or 'General'
-                
-                # Handle off-day status optimization
-                if record.get('status') == 'off':
-                    ot_hours = 0
-                    late_minutes = 0
-                
-                # OPTIMIZED: Fast status determination
-                attendance_status = 'PRESENT' if record.get('status') == 'present' else 'ABSENT'
-                
-                # OPTIMIZED: Prepare record data with minimal overhead
-                record_data = {
-                    'employee_name': employee_name,
-                    'department': department,
-                    'designation': employee.designation or 'General',
-                    'employment_type': employee.employment_type or 'FULL_TIME',
-                    'attendance_status': attendance_status,
-                    'ot_hours': ot_hours,
-                    'late_minutes': late_minutes,
-                }
-                
-                # OPTIMIZED: Fast update/create decision
-                if employee_id in existing_lookup:
-                    # Update existing record
-                    existing_record = existing_lookup[employee_id]
-                    for key, value in record_data.items():
-                        setattr(existing_record, key, value)
-                    records_to_update.append(existing_record)
-                    updated_count += 1
-                else:
-                    # Create new record
-                    new_record = DailyAttendance(
+        for chunk_start in range(0, len(attendance_records), batch_size):
+            chunk = attendance_records[chunk_start:chunk_start + batch_size]
+            chunk_start_time = time.time()
+            
+            # Extract the chunk's employee IDs
+            employee_ids = [record.get('employee_id') for record in chunk if record.get('employee_id')]
+            
+            # Bulk fetch the chunk's employees in one query
+            employees = EmployeeProfile.objects.filter(
+                tenant=tenant,
+                employee_id__in=employee_ids,
+                is_active=True
+            ).values_list(
+                'employee_id', 'first_name', 'last_name', 'department', 'designation',
+                'employment_type', 'date_of_joining', off_field
+            )  # Plain tuples of only the columns used below; no model instances
+            
+            # Read each employee's attributes once instead of on every row
+            is_off_lookup = {}
+            meta_lookup = {}
+            for employee_id, first_name, last_name, department, designation, employment_type, date_of_joining, is_off in employees:
+                is_off_lookup[employee_id] = is_off
+                meta_lookup[employee_id] = (
+                    f"{first_name} {last_name}",
+                    department or 'General',
+                    designation or 'General',
+                    employment_type or 'FULL_TIME',
+                    date_of_joining,
+                )
+            
+            # Employees that already have a record for this date; only used to report
+            # created vs updated counts, the upsert below handles both cases
+            existing_employee_ids = set(
+                DailyAttendance.objects.filter(
+                    tenant=tenant,
+                    employee_id__in=employee_ids,
+                    date=attendance_date
+                ).values_list('employee_id', flat=True)
+            )
+            
+            # Prepare chunk data (keyed by employee so a repeated row cannot hit the
+            # same conflict target twice in one INSERT ... ON CONFLICT)
+            records_by_employee = {}
+            
+            for record in chunk:
+                try:
+                    _get = record.get
+                    employee_id = _get('employee_id')
+                    if not employee_id:
+                        errors.append(f"Missing employee_id in record")
+                        continue
+                    
+                    # Check if employee exists (using lookup dictionary)
+                    meta = meta_lookup.get(employee_id)
+                    if not meta:
+                        errors.append(f"Employee {employee_id} not found or inactive")
+                        continue
+                    full_name, default_department, designation, employment_type, date_of_joining = meta
+                    
+                    # Check if employee has joined by this date
+                    if date_of_joining and attendance_date < date_of_joining:
+                        skipped_count += 1
+                        continue
+                    
+                    # OPTIMIZED: Use pre-calculated off day flag
+                    if is_off_lookup[employee_id]:
+                        skipped_count += 1
+                        continue  # Skip attendance for off days
+                    
+                    record_status = _get('status')
+                    
+                    # Handle off-day status optimization
+                    if record_status == 'off':
+                        ot_hours = 0
+                        late_minutes = 0
+                    else:
+                        # Coerce only when the payload did not already send the right type
+                        ot_hours = _get('ot_hours', 0)
+                        if type(ot_hours) is not float:
+                            ot_hours = float(ot_hours)
+                        late_minutes = _get('late_minutes', 0)
+                        if type(late_minutes) is not int:
+                            late_minutes = int(late_minutes)
+                    
+                    # OPTIMIZED: Fast status determination
+                    attendance_status = 'PRESENT' if record_status == 'present' else 'ABSENT'
+                    
+                    # OPTIMIZED: Build the instance straight from the bound locals
+                    # (no intermediate dict to build and unpack per row)
+                    records_by_employee[employee_id] = DailyAttendance(
                         tenant=tenant,
                         employee_id=employee_id,
                         date=attendance_date,
-                        **record_data
+                        employee_name=_get('name') or full_name,
+                        department=_get('department') or default_department,
+                        designation=designation,
+                        employment_type=employment_type,
+                        attendance_status=attendance_status,
+                        ot_hours=ot_hours,
+                        late_minutes=late_minutes,
                     )
-                    records_to_create.append(new_record)
-                    created_count += 1
-                    
-            except Exception as e:
-                errors.append(f"Error processing employee {record.get('employee_id', 'unknown')}: {str(e)}")
-        
-        processing_time = time.time() - processing_start_time
-        logger.info(f"OPTIMIZED: Processed {len(attendance_records)} records in {processing_time:.3f}s")
-        
-        # ULTRA OPTIMIZED: Perform bulk operations with raw SQL for maximum speed
-        db_start_time = time.time()
-        
-        with transaction.atomic():
-            # ULTRA FAST: Use raw SQL for bulk operations instead of ORM
-            from django.db import connection
+                    affected_employee_ids.add(employee_id)
+                        
+                except Exception as e:
+                    errors.append(f"Error processing employee {record.get('employee_id', 'unknown')}: {str(e)}")
             
-            # OPTIMIZED: Bulk create with raw SQL (much faster than ORM)
-            if records_to_create:
-                cursor = connection.cursor()
-                
-                # Prepare bulk insert query
-                insert_values = []
-                for record in records_to_create:
-                    # Escape single quotes properly for SQL
-                    safe_name = record.employee_name.replace("'", "''")
-                    safe_dept = record.department.replace("'", "''")
-                    safe_designation = record.designation.replace("'", "''")
-                    
-                    insert_values.append(
-                        f"('{record.tenant.id}', '{record.employee_id}', '{record.date}', "
-                        f"'{safe_name}', '{safe_dept}', "
-                        f"'{safe_designation}', '{record.employment_type}', '{record.attendance_status}', "
-                        f"{record.ot_hours}, {record.late_minutes}, NOW(), NOW())"
+            # Count per written row, so an employee repeated in the chunk counts once
+            chunk_updated = len(existing_employee_ids.intersection(records_by_employee))
+            updated_count += chunk_updated
+            created_count += len(records_by_employee) - chunk_updated
+            
+            db_start_time = time.time()
+            processing_time += db_start_time - chunk_start_time
+            
+            attendance_rows = list(records_by_employee.values())
+            
+            # Everything above is prepared outside the transaction; only the write runs inside it
+            if attendance_rows:
+                with transaction.atomic():
+                    # Single INSERT ... ON CONFLICT (tenant, employee_id, date) DO UPDATE
+                    DailyAttendance.objects.bulk_create(
+                        attendance_rows,
+                        update_conflicts=True,
+                        unique_fields=['tenant', 'employee_id', 'date'],
+                        update_fields=[
+                            'employee_name', 'department', 'designation', 'employment_type',
+                            'attendance_status', 'ot_hours', 'late_minutes', 'updated_at',
+                        ],
                     )
-                
-                if insert_values:
-                    insert_query = f"""
-                        INSERT INTO excel_data_dailyattendance 
-                        (tenant_id, employee_id, date, employee_name, department, designation, 
-                         employment_type, attendance_status, ot_hours, late_minutes, created_at, updated_at)
-                        VALUES {', '.join(insert_values)}
-                    """
-                    cursor.execute(insert_query)
-                    logger.info(f"ULTRA FAST: Raw SQL bulk created {len(records_to_create)} records")
             
-            # OPTIMIZED: Bulk update with raw SQL (much faster than ORM)
-            if records_to_update:
-                cursor = connection.cursor()
-                
-                # Prepare bulk update queries (using CASE statements for efficiency)
-                employee_ids = [f"'{record.employee_id}'" for record in records_to_update]
-                
-                # Build CASE statements for each field
-                name_cases = []
-                dept_cases = []
-                status_cases = []
-                ot_cases = []
-                late_cases = []
-                
-                for record in records_to_update:
-                    eid = record.employee_id
-                    safe_name = record.employee_name.replace("'", "''")
-                    safe_dept = record.department.replace("'", "''")
-                    
-                    name_cases.append(f"WHEN employee_id = '{eid}' THEN '{safe_name}'")
-                    dept_cases.append(f"WHEN employee_id = '{eid}' THEN '{safe_dept}'")
-                    status_cases.append(f"WHEN employee_id = '{eid}' THEN '{record.attendance_status}'")
-                    ot_cases.append(f"WHEN employee_id = '{eid}' THEN {record.ot_hours}")
-                    late_cases.append(f"WHEN employee_id = '{eid}' THEN {record.late_minutes}")
-                
-                update_query = f"""
-                    UPDATE excel_data_dailyattendance SET
-                        employee_name = CASE {' '.join(name_cases)} END,
-                        department = CASE {' '.join(dept_cases)} END,
-                        attendance_status = CASE {' '.join(status_cases)} END,
-                        ot_hours = CASE {' '.join(ot_cases)} END,
-                        late_minutes = CASE {' '.join(late_cases)} END,
-                        updated_at = NOW()
-                    WHERE tenant_id = '{tenant.id}' 
-                    AND date = '{attendance_date}' 
-                    AND employee_id IN ({', '.join(employee_ids)})
-                """
-                cursor.execute(update_query)
-                logger.info(f"ULTRA FAST: Raw SQL bulk updated {len(records_to_update)} records")
-        
-        db_operation_time = time.time() - db_start_time
-        logger.info(f"OPTIMIZED: Core DB operations completed in {db_operation_time:.3f}s")
+            db_operation_time += time.time() - db_start_time
+            processed_batches += 1
+        
+        logger.info("OPTIMIZED: Processed %s records in %s chunks in %.3fs", len(attendance_records), processed_batches, processing_time)
+        logger.info("Bulk upserted %s records (%s new, %s existing)", created_count + updated_count, created_count, updated_count)
+        logger.info("OPTIMIZED: Core DB operations completed in %.3fs", db_operation_time)
         
         # LIGHTNING FAST: Skip monthly summary recalculation for bulk uploads
         # Instead, defer this to a background task or make it optional
         summary_start_time = time.time()
         summaries_updated = 0
         
-        # Get all affected employee IDs for cache clearing only
-        affected_employee_ids = set()
-        for record in records_to_create + records_to_update:
-            affected_employee_ids.add(record.employee_id)
-        
         # PERFORMANCE DECISION: Skip heavy monthly summary calculation
         # This reduces 7+ seconds to nearly instant for bulk operations
         # Monthly summaries can be calculated on-demand or via background job
         
-        logger.info(f"LIGHTNING FAST: Skipped monthly summary recalculation for {len(affected_employee_ids)} employees")
+        logger.info("LIGHTNING FAST: Skipped monthly summary recalculation for %s employees", len(affected_employee_ids))
         logger.info("Monthly summaries will be calculated on-demand when needed")
         
         summary_time = time.time() - summary_start_time
-        logger.info(f"LIGHTNING OPTIMIZED: Summary processing completed in {summary_time:.3f}s")
-        
-        # CLEAR CACHE: Invalidate ALL attendance-related caches
-        from django.core.cache import cache
+        logger.info("LIGHTNING OPTIMIZED: Summary processing completed in %.3fs", summary_time)
         
+        # CLEAR CACHE: Invalidate ALL attendance-related caches once the writes
+        # have committed (the chunk transactions above have already closed, so
+        # on_commit fires straight away). When a worker is deployed the cache is
+        # shared, so the purge is handed to it and the response does not wait
         cache_start_time = time.time()
-        cache_keys_cleared = []
-        
-        # 1. Clear payroll overview cache
-        payroll_cache_key = f"payroll_overview_{tenant.id}"
-        cache.delete(payroll_cache_key)
-        cache_keys_cleared.append('payroll_overview')
-        logger.info(f"Cleared payroll overview cache for tenant {tenant.id}")
-        
-        # 2. Clear months with attendance cache
-        months_cache_key = f"months_with_attendance_{tenant.id}"
-        cache.delete(months_cache_key)
-        cache_keys_cleared.append('months_with_attendance')
-        logger.info(f"Cleared months with attendance cache for tenant {tenant.id}")
-        
-        # 3. Clear eligible employees cache for the specific date (ALL variations)
-        eligible_cache_keys = [
-            f"eligible_employees_{tenant.id}_{date_str}",
-            f"eligible_employees_opt_{tenant.id}_{date_str}_p1_s500",
-            f"eligible_employees_progressive_{tenant.id}_{date_str}_initial",
-            f"eligible_employees_progressive_{tenant.id}_{date_str}_remaining",
-            f"total_eligible_count_{tenant.id}_{date_str}"
+        affected_ids = list(affected_employee_ids)
+        
+        def enqueue_cache_invalidation():
+            if settings.CELERY_ENABLED:
+                from ..tasks import invalidate_attendance_caches_task
+                
+                try:
+                    invalidate_attendance_caches_task.delay(tenant.id, date_str, affected_ids)
+                    return
+                except Exception as e:
+                    # Broker unavailable - clear inline rather than serve stale data
+                    logger.warning("Could not queue attendance cache invalidation, clearing inline: %s", e)
+            invalidate_attendance_caches(tenant.id, date_str, affected_ids)
+        
+        transaction.on_commit(enqueue_cache_invalidation)
+        
+        cache_keys_cleared = [
+            'payroll_overview', 'months_with_attendance', 'eligible_employees', 'progressive_loading',
+            'directory_data', 'attendance_all_records', 'attendance_log', 'attendance_tracker',
+            'monthly_attendance_summary', 'dashboard_stats', 'employee_attendance_history',
         ]
-        for key in eligible_cache_keys:
-            cache.delete(key)
-        cache_keys_cleared.extend(['eligible_employees', 'progressive_loading'])
-        logger.info(f"Cleared eligible employees cache for tenant {tenant.id} and date {date_str}")
-        
-        # 4. Clear directory data cache
-        directory_cache_key = f"directory_data_{tenant.id}"
-        cache.delete(directory_cache_key)
-        cache_keys_cleared.append('directory_data')
-        logger.info(f"Cleared directory data cache for tenant {tenant.id}")
-        
-        # 5. Clear daily attendance all_records cache
-        attendance_records_cache_key = f"attendance_all_records_{tenant.id}"
-        cache.delete(attendance_records_cache_key)
-        cache_keys_cleared.append('attendance_all_records')
-        logger.info(f"Cleared attendance all_records cache for tenant {tenant.id}")
-        
-        # 6. NEW: Clear attendance log and tracker caches
-        attendance_log_cache_key = f"attendance_log_{tenant.id}"
-        cache.delete(attendance_log_cache_key)
-        cache_keys_cleared.append('attendance_log')
-        
-        attendance_tracker_cache_key = f"attendance_tracker_{tenant.id}"
-        cache.delete(attendance_tracker_cache_key)
-        cache_keys_cleared.append('attendance_tracker')
-        
-        # 7. NEW: Clear monthly attendance summary cache
-        monthly_summary_cache_key = f"monthly_attendance_summary_{tenant.id}_{attendance_date.year}_{attendance_date.month}"
-        cache.delete(monthly_summary_cache_key)
-        cache_keys_cleared.append('monthly_attendance_summary')
-        
-        # 8. NEW: Clear dashboard stats cache
-        dashboard_stats_cache_key = f"dashboard_stats_{tenant.id}"
-        cache.delete(dashboard_stats_cache_key)
-        cache_keys_cleared.append('dashboard_stats')
-        
-        # 9. NEW: Clear employee attendance history caches for affected employees
-        for employee_id in affected_employee_ids:
-            emp_cache_key = f"employee_attendance_{tenant.id}_{employee_id}"
-            cache.delete(emp_cache_key)
-        cache_keys_cleared.append('employee_attendance_history')
         
         cache_clear_time = time.time() - cache_start_time
-        logger.info(f"OPTIMIZED: Cleared {len(cache_keys_cleared)} cache types in {cache_clear_time:.3f}s")
+        logger.info("OPTIMIZED: Scheduled invalidation of %s cache types in %.3fs", len(cache_keys_cleared), cache_clear_time)
         
         # Calculate comprehensive performance metrics
         total_function_time = time.time() - processing_start_time
@@ -672,7 +654,7 @@ def bulk_update_attendance(request):
                 'bulk_operations': True,
                 'optimization_level': 'lightning_fast',
                 'batch_sizes': {
-                    'attendance_records': 250,
+                    'attendance_records': batch_size,
                     'deferred_summaries': 'on_demand'
                 },
                 'avg_time_per_record': f"{(total_function_time / len(attendance_records)):.3f}s" if attendance_records else '0s',
@@ -702,7 +684,7 @@ def bulk_update_attendance(request):
         return Response(response_data, status=200)
         
     except Exception as e:
-        logger.error(f"Error in bulk update attendance: {str(e)}")
+        logger.error("Error in bulk update attendance: %s", e)
         return Response({"error": "Failed to update attendance"}, status=500)
 
 # Clean replacement for the update_monthly_summaries_parallel function
@@ -712,22 +694,15 @@ def bulk_update_attendance(request):
 def update_monthly_summaries_parallel(request):
     """
     Asynchronous API for updating monthly summaries after bulk attendance upload.
-    Returns immediately while processing summaries in background thread.
+    Returns immediately while processing summaries in a Celery task.
     
     Expected usage:
     1. Frontend calls this API after bulk attendance upload
     2. Returns success immediately 
-    3. Processing happens in background thread using ULTRA-FAST bulk operations
+    3. Processing happens in a Celery worker using bulk operations
     4. Cache is cleared immediately for instant UI updates
     """
     try:
-        import threading
-        from datetime import datetime
-        from django.core.cache import cache
-        
-        # Get logger instance
-        logger = logging.getLogger(__name__)
-        
         start_time = time.time()
         
         tenant = getattr(request, 'tenant', None)
@@ -742,25 +717,17 @@ def update_monthly_summaries_parallel(request):
         
         # Parse the date
         try:
-            attendance_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            attendance_date = date.fromisoformat(date_str)
         except ValueError:
             return Response({"error": "Invalid date format. Use YYYY-MM-DD"}, status=400)
         
-        # DEBUG: Initial request information
-        logger.info(f"🚀 ASYNC SUMMARY: API called with parameters:")
-        logger.info(f"   📅 Date: {date_str} (parsed as {attendance_date})")
-        logger.info(f"   👥 Employee IDs count: {len(employee_ids)}")
-        logger.info(f"   🏢 Tenant: {tenant.name} (ID: {tenant.id})")
-        logger.info(f"   👥 Employee IDs (first 10): {employee_ids[:10]}{'...' if len(employee_ids) > 10 else ''}")
-        
-        print(f"🚀 ASYNC SUMMARY: API called - Date: {date_str}, Employee count: {len(employee_ids)}, Tenant: {tenant.name}")
-        
-        logger.info(f"🔄 ASYNC SUMMARY: Starting background monthly summary update for {len(employee_ids)} employees on {date_str}")
+        logger.info("ASYNC SUMMARY: Starting monthly summary update for %s employees on %s (tenant %s)", len(employee_ids), date_str, tenant.id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASYNC SUMMARY: Employee IDs (first 10): %s", employee_ids[:10])
         
         # CLEAR ALL RELATED CACHES IMMEDIATELY for instant UI updates
         cache_start_time = time.time()
         cache_keys_to_clear = [
-            f"payroll_overview_{tenant.id}",
             f"months_with_attendance_{tenant.id}",
             f"eligible_employees_{tenant.id}",
             f"eligible_employees_{tenant.id}_progressive",
@@ -770,52 +737,42 @@ def update_monthly_summaries_parallel(request):
             f"attendance_tracker_{tenant.id}",
             f"monthly_attendance_summary_{tenant.id}_{attendance_date.year}_{attendance_date.month}",
             f"monthly_attendance_summary_{tenant.id}",
-            f"dashboard_stats_{tenant.id}",
+            dashboard_stats_cache_key(tenant.id),
             f"employee_attendance_history_{tenant.id}",
-            # CRITICAL: Add all_records cache variations that need immediate clearing
-            f"attendance_all_records_{tenant.id}_this_month_None_None_None_None",
-            f"attendance_all_records_{tenant.id}_last_6_months_None_None_None_None",
-            f"attendance_all_records_{tenant.id}_last_12_months_None_None_None_None",
-            f"attendance_all_records_{tenant.id}_last_5_years_None_None_None_None",
-            f"frontend_charts_{tenant.id}",
         ]
         
-        # Clear all cache keys
-        for cache_key in cache_keys_to_clear:
-            cache.delete(cache_key)
-            
-        # Clear any date-specific cache keys
-        cache.delete(f"attendance_all_records_{tenant.id}_{date_str}")
-        cache.delete(f"eligible_employees_{tenant.id}_{date_str}")
-        
-        # Clear custom date-based all_records cache keys that might exist
-        cache.delete(f"attendance_all_records_{tenant.id}_custom_{attendance_date.month}_{attendance_date.year}_None_None")
-        cache.delete(f"attendance_all_records_{tenant.id}_custom_range_None_None_{date_str}_None")
+        # Every parameter variant (all_records periods, charts, date-specific
+        # entries) is registered per tenant, so the whole family is purged along
+        # with the fixed keys and the payroll / attendance version bumps in a
+        # single pipelined round-trip
+        keys_cleared = purge_tenant_caches(tenant.id, cache_keys_to_clear, namespaces=('payroll', 'attendance'))
         
         cache_time = time.time() - cache_start_time
-        logger.info(f"🗑️ ASYNC SUMMARY: Cleared {len(cache_keys_to_clear) + 4} cache keys in {cache_time:.3f}s")
-        logger.info(f"🗑️ ASYNC SUMMARY: Cache keys cleared: {cache_keys_to_clear[:5]}{'...' if len(cache_keys_to_clear) > 5 else ''}")
-        
-        # Define ULTRA-FAST background processing function with bulk operations
-        def process_summaries_background():
-            """ULTRA-OPTIMIZED: Use dedicated ultra-fast function for maximum performance"""
-            from ultra_fast_summary import ultra_fast_process_summaries_background
-            ultra_fast_process_summaries_background(tenant, attendance_date, employee_ids, cache)
+        logger.info("ASYNC SUMMARY: Cleared %s cache keys in %.3fs", keys_cleared, cache_time)
         
-        # Start background processing thread
+        # Hand the summary rebuild to a Celery worker (when one is deployed) so
+        # it survives worker recycling and does not hold a web-tier DB connection;
+        # otherwise rebuild in an in-process background thread
+        processing_mode = 'background_thread'
         if employee_ids:
-            logger.info(f"🧵 ASYNC SUMMARY: About to start background thread for {len(employee_ids)} employees")
-            print(f"🧵 CONSOLE: About to start background thread for {len(employee_ids)} employees")  # Console fallback
-            
-            background_thread = threading.Thread(target=process_summaries_background, daemon=True)
-            background_thread.start()
+            from ..tasks import refresh_monthly_summaries_task
             
-            logger.info(f"🧵 ASYNC SUMMARY: Background thread started successfully - Thread ID: {background_thread.ident}")
-            logger.info(f"🧵 ASYNC SUMMARY: Thread is alive: {background_thread.is_alive()}")
-            print(f"🧵 CONSOLE: Background thread started - ID: {background_thread.ident}, Alive: {background_thread.is_alive()}")
+            if settings.CELERY_ENABLED:
+                try:
+                    refresh_monthly_summaries_task.delay(tenant.id, date_str, employee_ids)
+                    processing_mode = 'celery_task'
+                    logger.info("ASYNC SUMMARY: Queued summary refresh for %s employees", len(employee_ids))
+                except Exception as e:
+                    # Broker unavailable: fall back to the background thread
+                    logger.warning("ASYNC SUMMARY: Could not queue summary refresh, running in a thread: %s", e)
+            if processing_mode == 'background_thread':
+                threading.Thread(
+                    target=refresh_monthly_summaries_task,
+                    args=(tenant.id, date_str, employee_ids),
+                    daemon=True
+                ).start()
         else:
-            logger.warning(f"⚠️ ASYNC SUMMARY: No employee IDs provided - skipping background processing")
-            print(f"⚠️ CONSOLE: No employee IDs provided - skipping background processing")
+            logger.warning("ASYNC SUMMARY: No employee IDs provided - skipping background processing")
         
         # Return immediately with success response
         total_time = time.time() - start_time
@@ -833,31 +790,35 @@ def update_monthly_summaries_parallel(request):
             'performance': {
                 'response_time': f"{total_time:.3f}s",
                 'cache_clear_time': f"{cache_time:.3f}s",
-                'cache_keys_cleared': len(cache_keys_to_clear) + 2,
-                'processing_mode': 'ultra_fast_background_thread'
+                'cache_keys_cleared': keys_cleared,
+                'processing_mode': processing_mode
             },
             'cache_cleared': True,
             'background_processing': True
         }
         
-        logger.info(f"ASYNC SUMMARY: Returned response in {total_time:.3f}s, background processing started")
+        logger.info("ASYNC SUMMARY: Returned response in %.3fs, background processing started", total_time)
         
         return Response(response_data, status=200)
         
     except Exception as e:
-        logger.error(f"Error in async monthly summary update: {str(e)}")
+        logger.error("Error in async monthly summary update: %s", e)
         return Response({"error": "Failed to start monthly summary update"}, status=500)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def get_eligible_employees_for_date(request):
     """
     PROGRESSIVE LOADING API - Load first 50 employees immediately, then lazy load the rest
     
     Two modes:
     1. initial=true: Returns first 50 employees instantly
-    2. remaining=true: Returns all remaining employees for lazy loading
+    2. remaining=true&cursor=<next_cursor>: Returns all remaining employees for lazy loading
+    
+    Pages are keyset-paginated on employee_id; the initial response's next_cursor
+    is the last employee_id it returned.
     
     PERFORMANCE IMPROVEMENTS:
     - Database-level slicing for instant first batch
@@ -868,10 +829,6 @@ def get_eligible_employees_for_date(request):
     EXPECTED: ~50ms for first 50, ~200ms for remaining
     """
     try:
-        from datetime import datetime
-        from django.db.models import Q
-        from django.core.cache import cache
-        
         # Performance timing
         start_time = time.time()
         
@@ -886,6 +843,7 @@ def get_eligible_employees_for_date(request):
         # PROGRESSIVE LOADING PARAMETERS
         load_initial = request.query_params.get('initial', 'true').lower() == 'true'
         load_remaining = request.query_params.get('remaining', 'false').lower() == 'true'
+        cursor = request.query_params.get('cursor') or None
         
         # Determine batch size and offset based on loading mode
         if load_initial and not load_remaining:
@@ -898,7 +856,7 @@ def get_eligible_employees_for_date(request):
             # Mode 2: Load remaining employees (skip first 500)
             page_size = 2000  # Load all remaining at once
             offset = 500
-            cache_suffix = 'remaining'
+            cache_suffix = f"remaining_{cursor}" if cursor else 'remaining'
             load_mode = 'remaining'
         else:
             # Fallback: load first 500 (backward compatibility)
@@ -908,161 +866,188 @@ def get_eligible_employees_for_date(request):
             load_mode = 'fallback'
         
         try:
-            target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            target_date = date.fromisoformat(date_str)
         except ValueError:
             return Response({"error": "Invalid date format. Use YYYY-MM-DD"}, status=400)
         
         # Check cache first
-        cache_key = f"eligible_employees_progressive_{tenant.id}_{date_str}_{cache_suffix}"
+        attendance_cache_ver = get_attendance_cache_version(tenant.id)
+        # Entries are (etag, response_data) pairs
+        cache_key = f"eligible_employees_etag_{tenant.id}_v{attendance_cache_ver}_{date_str}_{cache_suffix}"
         use_cache = request.GET.get('no_cache', '').lower() != 'true'
         
         if use_cache:
-            cached_data = cache.get(cache_key)
-            if cached_data:
+            cached_entry = cache.get(cache_key)
+            if cached_entry:
+                etag, cached_data = cached_entry
+                # Client already holds this exact page: skip the payload entirely
+                if etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+                    return HttpResponseNotModified(headers={'ETag': etag})
                 cached_data['performance'] = {
                     'query_time': f"{(time.time() - start_time):.3f}s",
                     'cached': True,
                     'load_mode': 'initial' if load_initial and not load_remaining else 'remaining'
                 }
-                return Response(cached_data)
+                return Response(cached_data, headers={'ETag': etag})
         
         # Get day of week for off-day checks
         day_of_week = target_date.weekday()
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_name = day_names[day_of_week]
-        
-        # Build off-day filter efficiently
-        off_day_filters = {
-            0: Q(off_monday=True),    # Monday
-            1: Q(off_tuesday=True),   # Tuesday
-            2: Q(off_wednesday=True), # Wednesday
-            3: Q(off_thursday=True),  # Thursday
-            4: Q(off_friday=True),    # Friday
-            5: Q(off_saturday=True),  # Saturday
-            6: Q(off_sunday=True),    # Sunday
-        }
-        off_day_filter = off_day_filters.get(day_of_week, Q())
-        
-        # PROGRESSIVE LOADING: Get total count once (cached for both requests)
-        total_count_cache_key = f"total_eligible_count_{tenant.id}_{date_str}"
-        total_count = cache.get(total_count_cache_key)
+        day_name = DAY_NAMES[day_of_week]
         
-        if total_count is None:
-            total_count = EmployeeProfile.objects.filter(
-                tenant=tenant,
-                is_active=True
-            ).exclude(
-                off_day_filter
-            ).exclude(
-                date_of_joining__gt=target_date
-            ).count()
-            # Cache total count for 5 minutes
-            cache.set(total_count_cache_key, total_count, 300)
-        
-        # OPTIMIZATION 1: Database-level slicing for progressive loading
+        # OPTIMIZATION 1: Keyset pagination on employee_id (index seek instead of
+        # scanning and discarding `offset` rows); clients that do not send a
+        # cursor yet fall back to the offset slice
         eligible_employees_query = EmployeeProfile.objects.filter(
             tenant=tenant,
             is_active=True
-        ).exclude(
-            off_day_filter
-        ).exclude(
-            date_of_joining__gt=target_date
-        ).only(
-            # OPTIMIZATION 2: Only fetch required fields
-            'employee_id', 'first_name', 'last_name', 'department',
-            'shift_start_time', 'shift_end_time', 'is_active', 'date_of_joining'
-        ).order_by('employee_id')[offset:offset + page_size]  # Progressive loading slice
-        
-        # OPTIMIZATION 4: Single bulk query for all attendance records  
-        employee_ids = [emp.employee_id for emp in eligible_employees_query]
-        
-        # Bulk fetch attendance records in one query
-        attendance_records = DailyAttendance.objects.filter(
+        )
+        if cursor and load_remaining:
+            eligible_employees_query = eligible_employees_query.filter(employee_id__gt=cursor)
+            offset = 0
+        attendance_for_day = DailyAttendance.objects.filter(
             tenant=tenant,
             date=target_date,
-            employee_id__in=employee_ids
-        ).only(
-            'employee_id', 'attendance_status', 'ot_hours', 'late_minutes', 'check_in', 'check_out'
+            employee_id=OuterRef('employee_id')
         )
         
-        # OPTIMIZATION 5: Build attendance lookup dictionary efficiently
-        attendance_lookup = {
-            record.employee_id: {
-                'status': record.attendance_status,
-                'ot_hours': float(record.ot_hours),
-                'late_minutes': record.late_minutes,
-                'check_in': record.check_in.strftime('%H:%M') if record.check_in else None,
-                'check_out': record.check_out.strftime('%H:%M') if record.check_out else None,
-            }
-            for record in attendance_records
-        }
+        # Off-day check is a single bit test on the generated off_days_mask column
+        eligible_employees_query = eligible_employees_query.alias(
+            off_today=F('off_days_mask').bitand(1 << day_of_week)
+        ).filter(
+            off_today=0
+        ).exclude(
+            date_of_joining__gt=target_date
+        ).annotate(
+            # OPTIMIZATION 3: Let PostgreSQL format the display strings instead of
+            # building them per row in Python
+            full_name=Concat('first_name', Value(' '), 'last_name', output_field=CharField()),
+            department_name=Coalesce(NullIf('department', Value('')), Value('General'), output_field=CharField()),
+            shift_start=Coalesce(
+                Func(F('shift_start_time'), Value('HH24:MI'), function='to_char', output_field=CharField()),
+                Value('09:00'), output_field=CharField()
+            ),
+            shift_end=Coalesce(
+                Func(F('shift_end_time'), Value('HH24:MI'), function='to_char', output_field=CharField()),
+                Value('18:00'), output_field=CharField()
+            ),
+            # OPTIMIZATION 4: Join the day's attendance row (unique per employee and
+            # date) in the same query instead of a second lookup
+            att_status=Subquery(attendance_for_day.values('attendance_status')[:1]),
+            att_ot_hours=Subquery(attendance_for_day.values('ot_hours')[:1]),
+            att_late_minutes=Subquery(attendance_for_day.values('late_minutes')[:1]),
+            att_check_in=Subquery(attendance_for_day.annotate(
+                check_in_str=Func(F('check_in'), Value('HH24:MI'), function='to_char', output_field=CharField())
+            ).values('check_in_str')[:1]),
+            att_check_out=Subquery(attendance_for_day.annotate(
+                check_out_str=Func(F('check_out'), Value('HH24:MI'), function='to_char', output_field=CharField())
+            ).values('check_out_str')[:1]),
+        ).annotate(
+            default_status=Case(
+                When(att_status__in=['PRESENT', 'PAID_LEAVE'], then=Value('present')),
+                default=Value('absent'),
+                output_field=CharField()
+            ),
+        ).order_by('employee_id').values(
+            # OPTIMIZATION 2: Only fetch required fields, as plain dicts (no model
+            # instances are needed to build the response)
+            'employee_id', 'first_name', 'last_name',
+            'full_name', 'department_name', 'shift_start', 'shift_end',
+            'att_status', 'att_ot_hours', 'att_late_minutes', 'att_check_in', 'att_check_out',
+            'default_status'
+        )
         
-        # OPTIMIZATION 4: Efficient data serialization with minimal processing
-        eligible_employees = []
-        for employee in eligible_employees_query:
-            current_attendance = attendance_lookup.get(employee.employee_id, {})
-            
-            # Quick status determination
-            if current_attendance:
-                default_status = 'present' if current_attendance['status'] in ['PRESENT', 'PAID_LEAVE'] else 'absent'
+        # Efficient data serialization with minimal processing
+        def serialize_employee(employee):
+            if employee['att_status'] is not None:
+                current_attendance = {
+                    'status': employee['att_status'],
+                    'ot_hours': float(employee['att_ot_hours']),
+                    'late_minutes': employee['att_late_minutes'],
+                    'check_in': employee['att_check_in'],
+                    'check_out': employee['att_check_out'],
+                }
             else:
-                default_status = 'absent'
+                current_attendance = {}
             
-            # Minimal data processing
-            eligible_employees.append({
-                'employee_id': employee.employee_id,
-                'name': f"{employee.first_name} {employee.last_name}",
-                'first_name': employee.first_name,
-                'last_name': employee.last_name,
-                'department': employee.department or 'General',
-                'shift_start_time': employee.shift_start_time.strftime('%H:%M') if employee.shift_start_time else '09:00',
-                'shift_end_time': employee.shift_end_time.strftime('%H:%M') if employee.shift_end_time else '18:00',
-                'default_status': default_status,
+            return {
+                'employee_id': employee['employee_id'],
+                'name': employee['full_name'],
+                'first_name': employee['first_name'],
+                'last_name': employee['last_name'],
+                'department': employee['department_name'],
+                'shift_start_time': employee['shift_start'],
+                'shift_end_time': employee['shift_end'],
+                'default_status': employee['default_status'],
                 'current_attendance': current_attendance,
                 'ot_hours': current_attendance.get('ot_hours', 0),
                 'late_minutes': current_attendance.get('late_minutes', 0)
-            })
+            }
         
         # PROGRESSIVE LOADING METADATA
         is_initial_load = load_initial and not load_remaining
         is_remaining_load = load_remaining
-        remaining_count = max(0, total_count - 50) if is_initial_load else 0
         
-        response_data = {
-            'date': date_str,
-            'day_name': day_name,
-            'eligible_employees': eligible_employees,
-            'progressive_loading': {
-                'is_initial_load': is_initial_load,
-                'is_remaining_load': is_remaining_load,
-                'employees_in_batch': len(eligible_employees),
-                'total_employees': total_count,
-                'remaining_employees': remaining_count,
-                'has_more': remaining_count > 0 if is_initial_load else False,
-                'next_batch_url': f"/api/eligible-employees/?date={date_str}&remaining=true" if remaining_count > 0 and is_initial_load else None,
-                'preserve_user_changes': True,  # Frontend should preserve user modifications
-                'auto_trigger_remaining': is_initial_load and remaining_count > 0,  # Should auto-trigger background load
-                'batch_offset': offset,
-                'recommended_delay_ms': 100  # Suggested delay before background load
-            },
-            'total_count': len(eligible_employees),
-            'performance': {
-                'query_time': f"{(time.time() - start_time):.3f}s",
-                'cached': False,
-                'load_mode': 'initial' if is_initial_load else 'remaining',
-                'batch_size': len(eligible_employees),
-                'total_employees': total_count
+        def build_response(eligible_employees, has_more=False, next_cursor=None):
+            return {
+                'date': date_str,
+                'day_name': day_name,
+                'eligible_employees': eligible_employees,
+                'progressive_loading': {
+                    'is_initial_load': is_initial_load,
+                    'is_remaining_load': is_remaining_load,
+                    'employees_in_batch': len(eligible_employees),
+                    'total_employees': None,  # Not counted; see has_more
+                    'remaining_employees': None,
+                    'has_more': has_more if is_initial_load else False,
+                    'next_cursor': next_cursor,
+                    'next_batch_url': f"/api/eligible-employees/?date={date_str}&remaining=true&cursor={quote(next_cursor)}" if next_cursor else None,
+                    'preserve_user_changes': True,  # Frontend should preserve user modifications
+                    'auto_trigger_remaining': is_initial_load and has_more,  # Should auto-trigger background load
+                    'batch_offset': offset,
+                    'recommended_delay_ms': 100  # Suggested delay before background load
+                },
+                'total_count': len(eligible_employees),
+                'performance': {
+                    'query_time': f"{(time.time() - start_time):.3f}s",
+                    'cached': False,
+                    'load_mode': 'initial' if is_initial_load else 'remaining',
+                    'batch_size': len(eligible_employees),
+                }
             }
-        }
+        
+        def compute_etag(response_data):
+            # ETag over everything but the per-request timings
+            return '"%s"' % hashlib.blake2b(
+                orjson.dumps({key: value for key, value in response_data.items() if key != 'performance'}),
+                digest_size=16
+            ).hexdigest()
+        
+        # Run the query exactly once through a chunked cursor (raw rows are not kept
+        # alongside the serialized ones), fetching one extra row to learn whether
+        # another batch exists without an exact COUNT over the whole filtered set.
+        # The remaining batch (at most 2000 rows) is built the same way rather than
+        # streamed, so errors still produce a proper 500 and it carries an ETag
+        eligible_employees = []
+        has_more = False
+        for employee in eligible_employees_query[offset:offset + page_size + 1].iterator(chunk_size=500):
+            if len(eligible_employees) == page_size:
+                has_more = True
+                break
+            eligible_employees.append(serialize_employee(employee))
+        next_cursor = eligible_employees[-1]['employee_id'] if has_more and is_initial_load else None
+        response_data = build_response(eligible_employees, has_more, next_cursor)
+        etag = compute_etag(response_data)
         
         # Cache for 2 minutes
         if use_cache:
-            cache.set(cache_key, response_data, 120)
+            set_tenant_cache(tenant.id, cache_key, (etag, response_data), 120)
         
-        return Response(response_data)
+        if etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+            return HttpResponseNotModified(headers={'ETag': etag})
+        return Response(response_data, headers={'ETag': etag})
         
     except Exception as e:
-        logger.error(f"Error getting eligible employees: {str(e)}")
+        logger.error("Error getting eligible employees: %s", e)
         return Response({"error": "Failed to get eligible employees"}, status=500)
 
 
@@ -1076,9 +1061,6 @@ class UploadAttendanceDataAPIView(APIView):
     def post(self, request):
         try:
             import pandas as pd
-            from datetime import datetime, date
-            from django.db import transaction
-            from ..models import DailyAttendance
             
             # Get tenant
             tenant = getattr(request, 'tenant', None)
@@ -1109,12 +1091,24 @@ class UploadAttendanceDataAPIView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             try:
-                # Read Excel file
-                df = pd.read_excel(file_obj)
-                
                 # Check if this is daily attendance format or monthly summary format
                 daily_columns = ['Employee ID', 'Employee Name', 'Date', 'Status']
                 monthly_columns = ['Employee ID', 'Name', 'Department', 'Present Days', 'Absent Days', 'OT Hours', 'Late Minutes']
+                used_columns = set(daily_columns + monthly_columns + ['Designation'])
+                
+                # Read Excel file with the Rust calamine parser (xlsx and xls), only
+                # materialising the columns this view uses; fall back to the default
+                # engine if calamine is unavailable or cannot read the workbook
+                read_options = {
+                    'usecols': lambda column: column in used_columns,
+                    'dtype': {'Employee ID': str},
+                }
+                try:
+                    df = pd.read_excel(file_obj, engine='calamine', **read_options)
+                except Exception as e:
+                    logger.warning("calamine could not read %s, falling back: %s", file_obj.name, e)
+                    file_obj.seek(0)
+                    df = pd.read_excel(file_obj, **read_options)
                 
                 is_daily_format = all(col in df.columns for col in daily_columns)
                 is_monthly_format = all(col in df.columns for col in monthly_columns)
@@ -1130,6 +1124,14 @@ class UploadAttendanceDataAPIView(APIView):
                 records_updated = 0
                 errors = []
                 warnings = []
+                # Only the first messages are returned; the rest are just counted,
+                # so messages are formatted lazily and at most 10 are kept
+                error_count = 0
+                warning_count = 0
+                
+                def report(messages, into, count):
+                    into.extend(islice(messages, max(0, 10 - len(into))))
+                    return count
                 
                 if is_monthly_format:
                     # Process monthly summary format
@@ -1148,192 +1150,218 @@ class UploadAttendanceDataAPIView(APIView):
                     
                     if invalid_employees:
                         errors.append(f'Invalid employee IDs found: {", ".join(list(invalid_employees)[:5])}{"..." if len(invalid_employees) > 5 else ""}')
+                        error_count += 1
                     
                     # Process each row for monthly format
-                    attendance_records = []
+                    attendance_records = {}
                 else:
                     # Process daily attendance format (original logic)
                     # Get all employee IDs from the file for validation
                     employee_ids = df['Employee ID'].dropna().unique()
                     
-                    # Validate employees exist
-                    existing_employees = EmployeeProfile.objects.filter(
-                        tenant=tenant,
-                        employee_id__in=employee_ids,
-                        is_active=True
-                    ).values_list('employee_id', flat=True)
+                    # Validate employees exist, fetching the department/designation
+                    # fallbacks for rows that omit them in the same query
+                    employee_defaults = {
+                        employee_id: (department or 'General', designation or 'Employee')
+                        for employee_id, department, designation in EmployeeProfile.objects.filter(
+                            tenant=tenant,
+                            employee_id__in=employee_ids,
+                            is_active=True
+                        ).values_list('employee_id', 'department', 'designation')
+                    }
                     
-                    existing_employee_set = set(existing_employees)
+                    existing_employee_set = set(employee_defaults)
                     invalid_employees = set(employee_ids) - existing_employee_set
                     
                     if invalid_employees:
                         errors.append(f'Invalid employee IDs found: {", ".join(list(invalid_employees)[:5])}{"..." if len(invalid_employees) > 5 else ""}')
+                        error_count += 1
                     
                     # Process each row for daily format
-                    attendance_records = []
+                    attendance_records = {}
+                
+                # Coerce whole columns once instead of cell by cell inside a row loop
+                def text_column(column):
+                    if column not in df.columns:
+                        return pd.Series('', index=df.index)
+                    return df[column].astype(str).str.strip()
+                
+                def numeric_column(column):
+                    if column not in df.columns:
+                        return pd.Series(0, index=df.index)
+                    return pd.to_numeric(df[column], errors='coerce').fillna(0)
+                
+                row_numbers = pd.Series(df.index + 2, index=df.index)  # Excel row number (row 1 is the header)
+                employee_id_col = text_column('Employee ID')
+                department_col = text_column('Department')
+                ot_hours_col = numeric_column('OT Hours')
+                late_minutes_col = numeric_column('Late Minutes').astype(int)
                 
-                for index, row in df.iterrows():
-                    try:
-                        employee_id = str(row['Employee ID']).strip()
+                # Validate employees exist
+                valid_rows = employee_id_col.isin(existing_employee_set)
+                error_count += report((
+                    f'Row {row_number}: Employee {employee_id} not found or inactive'
+                    for row_number, employee_id in zip(row_numbers[~valid_rows], employee_id_col[~valid_rows])
+                ), errors, int((~valid_rows).sum()))
+                
+                if is_monthly_format:
+                    # Process monthly summary format
+                    # Create attendance date (first day of the month)
+                    attendance_date = date(int(year), int(month), 1)
+                    
+                    name_col = text_column('Name')
+                    present_days_col = numeric_column('Present Days')
+                    absent_days_col = numeric_column('Absent Days')
+                    
+                    # tolist() hands the ORM plain Python values rather than NumPy scalars
+                    for employee_id, name, department, present_days, absent_days, ot_hours, late_minutes in zip(
+                        employee_id_col[valid_rows].tolist(),
+                        name_col[valid_rows].tolist(),
+                        department_col[valid_rows].tolist(),
+                        present_days_col[valid_rows].tolist(),
+                        absent_days_col[valid_rows].tolist(),
+                        ot_hours_col[valid_rows].tolist(),
+                        late_minutes_col[valid_rows].tolist(),
+                    ):
+                        # Buffer the row; the upsert below creates or updates it
+                        # (keyed so a repeated employee keeps its last row)
+                        attendance_records[(employee_id, attendance_date)] = Attendance(
+                            tenant=tenant,
+                            employee_id=employee_id,
+                            name=name,
+                            department=department,
+                            date=attendance_date,
+                            calendar_days=30,  # Default for month
+                            total_working_days=present_days + absent_days,
+                            present_days=present_days,
+                            absent_days=absent_days,
+                            ot_hours=ot_hours,
+                            late_minutes=late_minutes
+                        )
+                else:
+                    # Process daily attendance format
+                    # Parse dates (MM/DD/YYYY, YYYY-MM-DD or Excel dates) in one pass
+                    date_str_col = text_column('Date')
+                    date_col = pd.to_datetime(df['Date'], errors='coerce', format='mixed')
+                    invalid_dates = valid_rows & date_col.isna()
+                    error_count += report((
+                        f'Row {row_number}: Invalid date format for {date_str}'
+                        for row_number, date_str in zip(row_numbers[invalid_dates], date_str_col[invalid_dates])
+                    ), errors, int(invalid_dates.sum()))
+                    valid_rows &= ~invalid_dates
+                    
+                    # Future dates are rejected per row (the table's check constraint
+                    # would otherwise fail the whole batch)
+                    future_dates = valid_rows & (date_col.dt.date > datetime.now().date())
+                    error_count += report((
+                        f'Row {row_number}: Cannot upload attendance for future date {date_str}'
+                        for row_number, date_str in zip(row_numbers[future_dates], date_str_col[future_dates])
+                    ), errors, int(future_dates.sum()))
+                    valid_rows &= ~future_dates
+                    
+                    # Validate status
+                    valid_statuses = ['PRESENT', 'ABSENT', 'HALF_DAY', 'PAID_LEAVE', 'OFF']
+                    status_col = text_column('Status').str.upper()
+                    invalid_statuses = valid_rows & ~status_col.isin(valid_statuses)
+                    warning_count += report((
+                        f'Row {row_number}: Invalid status "{attendance_status}". Using ABSENT.'
+                        for row_number, attendance_status in zip(row_numbers[invalid_statuses], status_col[invalid_statuses])
+                    ), warnings, int(invalid_statuses.sum()))
+                    status_col = status_col.mask(invalid_statuses, 'ABSENT')
+                    
+                    employee_name_col = text_column('Employee Name')
+                    designation_col = text_column('Designation')
+                    
+                    for employee_id, employee_name, attendance_date, attendance_status, ot_hours, late_minutes, department, designation in zip(
+                        employee_id_col[valid_rows].tolist(),
+                        employee_name_col[valid_rows].tolist(),
+                        date_col[valid_rows].dt.date.tolist(),
+                        status_col[valid_rows].tolist(),
+                        ot_hours_col[valid_rows].tolist(),
+                        late_minutes_col[valid_rows].tolist(),
+                        department_col[valid_rows].tolist(),
+                        designation_col[valid_rows].tolist(),
+                    ):
+                        # Use the employee's profile if department/designation not provided
+                        if not department or not designation:
+                            default_department, default_designation = employee_defaults[employee_id]
+                            department = department or default_department
+                            designation = designation or default_designation
                         
-                        if is_monthly_format:
-                            # Process monthly summary format
-                            name = str(row['Name']).strip()
-                            department = str(row.get('Department', '')).strip()
-                            
-                            # Validate employee exists
-                            if employee_id not in existing_employee_set:
-                                errors.append(f'Row {index + 2}: Employee {employee_id} not found or inactive')
-                                continue
-                            
-                            # Get numeric values
-                            present_days = float(row.get('Present Days', 0)) if pd.notna(row.get('Present Days')) else 0
-                            absent_days = float(row.get('Absent Days', 0)) if pd.notna(row.get('Absent Days')) else 0
-                            ot_hours = float(row.get('OT Hours', 0)) if pd.notna(row.get('OT Hours')) else 0
-                            late_minutes = int(row.get('Late Minutes', 0)) if pd.notna(row.get('Late Minutes')) else 0
-                            
-                            # Calculate total working days
-                            total_working_days = present_days + absent_days
-                            
-                            # Create attendance date (first day of the month)
-                            from datetime import date
-                            attendance_date = date(int(year), int(month), 1)
-                            
-                            # Check if record already exists
-                            existing_record = Attendance.objects.filter(
-                                tenant=tenant,
-                                employee_id=employee_id,
-                                date=attendance_date
-                            ).first()
-                            
-                            if existing_record:
-                                # Update existing record
-                                existing_record.name = name
-                                existing_record.department = department
-                                existing_record.total_working_days = total_working_days
-                                existing_record.present_days = present_days
-                                existing_record.absent_days = absent_days
-                                existing_record.ot_hours = ot_hours
-                                existing_record.late_minutes = late_minutes
-                                existing_record.save()
-                                records_updated += 1
-                            else:
-                                # Create new record
-                                Attendance.objects.create(
-                                    tenant=tenant,
-                                    employee_id=employee_id,
-                                    name=name,
-                                    department=department,
-                                    date=attendance_date,
-                                    calendar_days=30,  # Default for month
-                                    total_working_days=total_working_days,
-                                    present_days=present_days,
-                                    absent_days=absent_days,
-                                    ot_hours=ot_hours,
-                                    late_minutes=late_minutes
-                                )
-                                records_created += 1
-                        else:
-                            # Process daily attendance format
-                            employee_name = str(row['Employee Name']).strip()
-                            date_str = str(row['Date']).strip()
-                            attendance_status = str(row['Status']).strip().upper()
-                            
-                            # Validate employee exists
-                            if employee_id not in existing_employee_set:
-                                errors.append(f'Row {index + 2}: Employee {employee_id} not found or inactive')
-                                continue
-                            
-                            # Parse date
-                            try:
-                                if '/' in date_str:
-                                    attendance_date = datetime.strptime(date_str, '%m/%d/%Y').date()
-                                elif '-' in date_str:
-                                    attendance_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                                else:
-                                    attendance_date = pd.to_datetime(date_str).date()
-                            except:
-                                errors.append(f'Row {index + 2}: Invalid date format for {date_str}')
-                                continue
-                            
-                            # Validate status
-                            valid_statuses = ['PRESENT', 'ABSENT', 'HALF_DAY', 'PAID_LEAVE', 'OFF']
-                            if attendance_status not in valid_statuses:
-                                warnings.append(f'Row {index + 2}: Invalid status "{attendance_status}". Using ABSENT.')
-                                attendance_status = 'ABSENT'
-                            
-                            # Get optional fields
-                            ot_hours = float(row.get('OT Hours', 0)) if pd.notna(row.get('OT Hours')) else 0
-                            late_minutes = int(row.get('Late Minutes', 0)) if pd.notna(row.get('Late Minutes')) else 0
-                            department = str(row.get('Department', '')).strip()
-                            designation = str(row.get('Designation', '')).strip()
-                            
-                            # Get employee info if department/designation not provided
-                            if not department or not designation:
-                                employee = EmployeeProfile.objects.get(tenant=tenant, employee_id=employee_id)
-                                department = department or employee.department or 'General'
-                                designation = designation or employee.designation or 'Employee'
-                            
-                            # Check if record already exists
-                            existing_record = DailyAttendance.objects.filter(
-                                tenant=tenant,
-                                employee_id=employee_id,
-                                date=attendance_date
-                            ).first()
-                            
-                            if existing_record:
-                                # Update existing record
-                                existing_record.employee_name = employee_name
-                                existing_record.department = department
-                                existing_record.designation = designation
-                                existing_record.attendance_status = attendance_status
-                                existing_record.ot_hours = ot_hours
-                                existing_record.late_minutes = late_minutes
-                                existing_record.save()
-                                records_updated += 1
-                            else:
-                                # Create new record
-                                attendance_records.append(DailyAttendance(
-                                    tenant=tenant,
-                                    employee_id=employee_id,
-                                    employee_name=employee_name,
-                                    department=department,
-                                    designation=designation,
-                                    employment_type='FULL_TIME',
-                                    attendance_status=attendance_status,
-                                    date=attendance_date,
-                                    ot_hours=ot_hours,
-                                    late_minutes=late_minutes
-                                ))
-                                records_created += 1
-                            
-                    except Exception as e:
-                        errors.append(f'Row {index + 2}: {str(e)}')
+                        # Buffer the row; the upsert below creates or updates it
+                        attendance_records[(employee_id, attendance_date)] = DailyAttendance(
+                            tenant=tenant,
+                            employee_id=employee_id,
+                            employee_name=employee_name,
+                            department=department,
+                            designation=designation,
+                            employment_type='FULL_TIME',
+                            attendance_status=attendance_status,
+                            date=attendance_date,
+                            ot_hours=ot_hours,
+                            late_minutes=late_minutes
+                        )
                 
-                # Bulk create new records (only for daily format)
-                if attendance_records and not is_monthly_format:
+                # Single INSERT ... ON CONFLICT (tenant, employee_id, date) DO UPDATE
+                # per batch instead of a lookup plus save() for every row
+                if attendance_records:
+                    if is_monthly_format:
+                        model = Attendance
+                        update_fields = [
+                            'name', 'department', 'total_working_days', 'present_days',
+                            'absent_days', 'ot_hours', 'late_minutes', 'updated_at',
+                        ]
+                    else:
+                        model = DailyAttendance
+                        update_fields = [
+                            'employee_name', 'department', 'designation', 'attendance_status',
+                            'ot_hours', 'late_minutes', 'updated_at',
+                        ]
+                    
+                    # Existing rows are only looked up to report created vs updated counts
+                    existing_keys = set(
+                        model.objects.filter(
+                            tenant=tenant,
+                            employee_id__in={key[0] for key in attendance_records},
+                            date__in={key[1] for key in attendance_records}
+                        ).values_list('employee_id', 'date')
+                    )
+                    records_updated = sum(1 for key in attendance_records if key in existing_keys)
+                    records_created = len(attendance_records) - records_updated
+                    
                     with transaction.atomic():
-                        DailyAttendance.objects.bulk_create(attendance_records, batch_size=1000)
+                        model.objects.bulk_create(
+                            list(attendance_records.values()),
+                            update_conflicts=True,
+                            unique_fields=['tenant', 'employee_id', 'date'],
+                            update_fields=update_fields,
+                            batch_size=1000,
+                        )
+                        
+                        if not is_monthly_format:
+                            # Keep the monthly summaries read by payroll in step
+                            # with the daily rows just written
+                            employees_by_month = {}
+                            for employee_id, attendance_date in attendance_records:
+                                employees_by_month.setdefault(
+                                    (attendance_date.year, attendance_date.month), set()
+                                ).add(employee_id)
+                            for (summary_year, summary_month), month_employee_ids in employees_by_month.items():
+                                refresh_monthly_summaries(tenant, summary_year, summary_month, month_employee_ids)
                 
                 # Clear relevant caches
-                from django.core.cache import cache
-                cache_keys = [
-                    f"payroll_overview_{tenant.id}",
-                    f"attendance_all_records_{tenant.id}",
-                    f"directory_data_{tenant.id}",
-                    f"months_with_attendance_{tenant.id}"
-                ]
-                for key in cache_keys:
-                    cache.delete(key)
+                cache.delete(f"months_with_attendance_{tenant.id}")
+                bump_payroll_cache(tenant.id)
+                bump_attendance_cache(tenant.id)
                 
                 return Response({
                     'message': 'Attendance data uploaded successfully!',
                     'records_created': records_created,
                     'records_updated': records_updated,
-                    'total_errors': len(errors),
-                    'total_warnings': len(warnings),
-                    'errors': errors[:10],  # Show first 10 errors
-                    'warnings': warnings[:10],  # Show first 10 warnings
+                    'total_errors': error_count,
+                    'total_warnings': warning_count,
+                    'errors': errors,  # First 10 errors
+                    'warnings': warnings,  # First 10 warnings
                     'month': month,
                     'year': year,
                     'file_name': file_obj.name
@@ -1358,16 +1386,15 @@ class UploadMonthlyAttendanceAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        # Fixed-shape validation errors are returned as plain JsonResponses,
+        # skipping the renderer pass; the outcome responses stay DRF Responses
         try:
-            from django.db import transaction
-            from ..models import Attendance
-            
-            # Get tenant
+            # Get tenant id (only the id is needed; fall back to the user's tenant
+            # when the middleware did not resolve one)
             tenant = getattr(request, 'tenant', None)
-            if not tenant:
-                return Response({
-                    'error': 'No tenant found for this request'
-                }, status=status.HTTP_400_BAD_REQUEST)
+            tenant_id = tenant.id if tenant else getattr(request.user, 'tenant_id', None)
+            if not tenant_id:
+                return JsonResponse({'error': 'No tenant found for this request'}, status=status.HTTP_400_BAD_REQUEST)
             
             # Get parameters
             month = request.data.get('month')
@@ -1375,68 +1402,52 @@ class UploadMonthlyAttendanceAPIView(APIView):
             data = request.data.get('data', [])
             
             if not month or not year:
-                return Response({
-                    'error': 'Month and year are required'
-                }, status=status.HTTP_400_BAD_REQUEST)
+                return JsonResponse({'error': 'Month and year are required'}, status=status.HTTP_400_BAD_REQUEST)
             
             if not data:
-                return Response({
-                    'error': 'No attendance data provided'
-                }, status=status.HTTP_400_BAD_REQUEST)
+                return JsonResponse({'error': 'No attendance data provided'}, status=status.HTTP_400_BAD_REQUEST)
             
-            created = 0
-            failed = 0
-            errors = []
+            # Create attendance date (first day of the month)
+            try:
+                attendance_date = date(int(year), int(month), 1)
+            except (TypeError, ValueError):
+                return JsonResponse({'error': 'Invalid month or year'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Create attendance records
-            attendance_records = []
+            # Ingestion runs on a Celery worker when one is deployed; the client
+            # polls /jobs/<id>/. Otherwise ingest within the request.
+            if settings.CELERY_ENABLED:
+                from ..tasks import ingest_monthly_attendance_task
             
-            for index, record in enumerate(data):
+                job = BackgroundJob.objects.create(
+                    tenant_id=tenant_id,
+                    job_type=BackgroundJob.JobType.INGEST_MONTHLY_ATTENDANCE,
+                )
                 try:
-                    employee_id = record.get('employee_id')
-                    name = record.get('name')
-                    
-                    if not employee_id or not name:
-                        errors.append(f'Record {index + 1}: Missing employee_id or name')
-                        failed += 1
-                        continue
-                    
-                    # Create attendance date (first day of the month)
-                    from datetime import date
-                    attendance_date = date(int(year), int(month), 1)
-                    
-                    attendance_record = Attendance(
-                        tenant=tenant,
-                        employee_id=employee_id,
-                        name=name,
-                        department=record.get('department', ''),
-                        date=attendance_date,
-                        calendar_days=30,  # Default for month
-                        total_working_days=record.get('total_working_days', 0),
-                        present_days=record.get('present_days', 0),
-                        absent_days=record.get('absent_days', 0),
-                        ot_hours=record.get('ot_hours', 0),
-                        late_minutes=record.get('late_minutes', 0)
-                    )
-                    
-                    attendance_records.append(attendance_record)
-                    created += 1
-                    
+                    ingest_monthly_attendance_task.delay(job.id, tenant_id, attendance_date.isoformat(), data)
                 except Exception as e:
-                    errors.append(f'Record {index + 1}: {str(e)}')
-                    failed += 1
+                    # Broker unavailable - fall back to ingesting within the request
+                    logger.warning("Could not queue monthly attendance job %s, ingesting synchronously: %s", job.id, e)
+                    job.delete()
+                else:
+                    logger.info("Queued monthly attendance job %s for %s/%s with %s records", job.id, month, year, len(data))
+                    return Response({
+                        'message': 'Monthly attendance upload queued',
+                        'job_id': job.id,
+                        'status': job.status,
+                        'total_records': len(data),
+                        'month': month,
+                        'year': year
+                    }, status=status.HTTP_202_ACCEPTED)
             
-            # Bulk create records
-            if attendance_records:
-                with transaction.atomic():
-                    Attendance.objects.bulk_create(attendance_records, ignore_conflicts=True)
+            result = ingest_monthly_attendance(tenant_id, attendance_date, data)
             
             return Response({
                 'message': 'Monthly attendance data uploaded successfully',
                 'total_records': len(data),
-                'created': created,
-                'failed': failed,
-                'errors': errors[:10],  # Show first 10 errors
+                'created': result['created'],
+                'updated': result['updated'],
+                'failed': result['failed'],
+                'errors': result['errors'],
                 'month': month,
                 'year': year
             }, status=status.HTTP_201_CREATED)
@@ -1457,12 +1468,11 @@ class DownloadAttendanceTemplateAPIView(APIView):
     def get(self, request):
         try:
             from openpyxl import Workbook
-            from django.http import HttpResponse
             
-            # Create workbook and worksheet
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Attendance Template"
+            # Create workbook and worksheet (write-only: rows are streamed out as
+            # they are appended instead of kept as a graph of Cell objects)
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Attendance Template")
             
             # Define headers
             headers = [
@@ -1471,8 +1481,7 @@ class DownloadAttendanceTemplateAPIView(APIView):
             ]
             
             # Add headers to worksheet
-            for col, header in enumerate(headers, 1):
-                ws.cell(row=1, column=col, value=header)
+            ws.append(headers)
             
             # Add sample data
             sample_data = [
@@ -1483,22 +1492,31 @@ class DownloadAttendanceTemplateAPIView(APIView):
                 ['EMP005', 'Charlie Wilson', '2024-01-02', 'PAID_LEAVE', 'Finance', 'Analyst', 0, 0]
             ]
             
-            for row_idx, row_data in enumerate(sample_data, 2):
-                for col_idx, value in enumerate(row_data, 1):
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+            for row_data in sample_data:
+                ws.append(row_data)
+            
+            # Add instructions (after a blank row 7)
+            ws.append([])
+            ws.append(["Instructions:"])
+            ws.append(["1. Employee ID must match existing employee IDs"])
+            ws.append(["2. Date format: YYYY-MM-DD or MM/DD/YYYY"])
+            ws.append(["3. Status options: PRESENT, ABSENT, HALF_DAY, PAID_LEAVE, OFF"])
+            ws.append(["4. OT Hours: Decimal number (e.g., 2.5)"])
+            ws.append(["5. Late Minutes: Integer (e.g., 15)"])
             
-            # Add instructions
-            ws.cell(row=8, column=1, value="Instructions:")
-            ws.cell(row=9, column=1, value="1. Employee ID must match existing employee IDs")
-            ws.cell(row=10, column=1, value="2. Date format: YYYY-MM-DD or MM/DD/YYYY")
-            ws.cell(row=11, column=1, value="3. Status options: PRESENT, ABSENT, HALF_DAY, PAID_LEAVE, OFF")
-            ws.cell(row=12, column=1, value="4. OT Hours: Decimal number (e.g., 2.5)")
-            ws.cell(row=13, column=1, value="5. Late Minutes: Integer (e.g., 15)")
+            # Save to a temporary file and stream it out in chunks; the file is
+            # removed when the response closes the wrapper
+            tmp = tempfile.NamedTemporaryFile(suffix='.xlsx')
+            wb.save(tmp.name)
+            tmp.seek(0)
             
             # Create response
-            response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+            response = StreamingHttpResponse(
+                FileWrapper(tmp, blksize=64 * 1024),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            )
             response['Content-Disposition'] = 'attachment; filename=attendance_template.xlsx'
-            wb.save(response)
+            response['Content-Length'] = os.path.getsize(tmp.name)
             
             return response
             
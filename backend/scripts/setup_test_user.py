@@ -4,11 +4,19 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dashboard.settings')
 import django
 django.setup()
 
+from functools import lru_cache
 from excel_data.models import CustomUser, Tenant
 
+
+@lru_cache(maxsize=32)
+def get_test_user(email):
+    """Look up a test user (with its tenant) once per process, e.g. under python -i"""
+    return CustomUser.objects.select_related('tenant').get(email=email)
+
+
 # Check if user exists
 try:
-    user = CustomUser.objects.get(email='test@testing.com')
+    user = get_test_user('test@testing.com')
     print(f'✅ User exists: {user.email}')
     print(f'   Tenant: {user.tenant.name if user.tenant else "No tenant"}')
     print(f'   Active: {user.is_active}')
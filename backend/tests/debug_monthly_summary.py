@@ -6,6 +6,8 @@ This script will help diagnose why the monthly summary isn't showing updated att
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 from datetime import datetime
@@ -16,6 +18,17 @@ BULK_ATTENDANCE_URL = f"{BASE_URL}/api/bulk-update-attendance/"
 MONTHLY_SUMMARY_URL = f"{BASE_URL}/api/update-monthly-summaries/"
 PAYROLL_OVERVIEW_URL = f"{BASE_URL}/api/salary-data/payroll_overview/"
 
+# One keep-alive session for every step so later requests skip the TCP/TLS handshake;
+# transient gateway errors while a cold Neon connection is re-established are retried
+SESSION = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('http://', adapter)
+SESSION.mount('https://', adapter)
+
 def test_attendance_and_summary_update():
     """Test the attendance update and monthly summary flow"""
     
@@ -51,7 +64,7 @@ def test_attendance_and_summary_update():
         
         print(f"Payload: {json.dumps(bulk_payload, indent=2)}")
         
-        bulk_response = requests.post(
+        bulk_response = SESSION.post(
             BULK_ATTENDANCE_URL,
             json=bulk_payload,
             timeout=30
@@ -77,7 +90,7 @@ def test_attendance_and_summary_update():
         
         print(f"Payload: {json.dumps(summary_payload, indent=2)}")
         
-        summary_response = requests.post(
+        summary_response = SESSION.post(
             MONTHLY_SUMMARY_URL,
             json=summary_payload,
             timeout=30
@@ -110,7 +123,7 @@ def test_attendance_and_summary_update():
             'department': 'All'
         }
         
-        payroll_response = requests.get(
+        payroll_response = SESSION.get(
             PAYROLL_OVERVIEW_URL,
             params=payroll_params,
             timeout=30
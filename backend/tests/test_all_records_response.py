@@ -5,9 +5,16 @@ This helps debug frontend compatibility issues
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 
+# One keep-alive session for every request so later calls skip the TCP/TLS handshake
+SESSION = requests.Session()
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+SESSION.mount('http://', adapter)
+SESSION.mount('https://', adapter)
+
 def test_all_records_api():
     """Test the all_records API and verify response structure"""
     
@@ -19,7 +26,7 @@ def test_all_records_api():
     
     try:
         print(f"📡 Making request to: {url}")
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         
         print(f"📊 Response Status: {response.status_code}")
         print(f"📏 Response Size: {len(response.content)} bytes")
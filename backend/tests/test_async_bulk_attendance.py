@@ -13,9 +13,12 @@ This script tests:
 import os
 import sys
 import django
+import numpy as np
 import requests
 import json
+import orjson
 import time
+from dataclasses import dataclass
 from datetime import datetime, date
 
 # Setup Django
@@ -25,6 +28,23 @@ django.setup()
 from excel_data.models import CustomUser, EmployeeProfile, DailyAttendance, MonthlyAttendanceSummary
 from django.contrib.auth import authenticate
 from django.core.cache import cache
+from excel_data.services.cache_service import dashboard_stats_cache_key
+
+@dataclass(slots=True)
+class AttendanceRecord:
+    """One bulk-update-attendance record; orjson serialises slotted dataclasses natively in C"""
+    employee_id: str
+    name: str
+    department: str
+    date: str
+    status: str
+    present_days: int
+    absent_days: int
+    ot_hours: int
+    late_minutes: int
+    calendar_days: int = 1
+    total_working_days: int = 1
+
 
 class AsyncBulkAttendanceTest:
     def __init__(self):
@@ -33,6 +53,11 @@ class AsyncBulkAttendanceTest:
         self.token = None
         self.tenant_id = None
         self.test_date = "2025-07-25"
+        # Raise to benchmark the scaling curve (50 -> 1k -> 10k -> 50k records)
+        self.employee_limit = 50
+        # Records per bulk-update-attendance request; the endpoint's bulk path
+        # is most efficient with large slabs rather than many small posts
+        self.upload_batch_size = 10000
         
     def login(self):
         """Login and get authentication token"""
@@ -63,7 +88,7 @@ class AsyncBulkAttendanceTest:
             data = response.json()
             employees = data.get('employees', [])
             print(f"✅ Found {len(employees)} eligible employees")
-            return employees[:50]  # Use first 50 for testing
+            return employees[:self.employee_limit]
         else:
             print(f"❌ Failed to get employees: {response.status_code}")
             return []
@@ -73,57 +98,85 @@ class AsyncBulkAttendanceTest:
         print("\n🚀 TESTING LIGHTNING-FAST BULK ATTENDANCE UPLOAD")
         print("=" * 60)
         
-        # Create attendance data
-        attendance_records = []
-        for i, emp in enumerate(employees):
-            status = 'present' if i % 3 != 2 else 'absent'  # Mix of present/absent
-            attendance_records.append({
-                'employee_id': emp['employee_id'],
-                'name': emp['name'],
-                'department': emp.get('department', 'Unknown'),
-                'date': self.test_date,
-                'status': status,
-                'present_days': 1 if status == 'present' else 0,
-                'absent_days': 1 if status == 'absent' else 0,
-                'ot_hours': 2 if status == 'present' and i % 5 == 0 else 0,
-                'late_minutes': 15 if status == 'present' and i % 7 == 0 else 0,
-                'calendar_days': 1,
-                'total_working_days': 1
-            })
-        
-        payload = {
-            'date': self.test_date,
-            'attendance_records': attendance_records
-        }
+        # Create attendance data: per-employee values are computed as whole arrays,
+        # then tolist() hands plain Python values to the JSON encoder
+        idx = np.arange(len(employees))
+        present = idx % 3 != 2  # Mix of present/absent
+        statuses = np.where(present, 'present', 'absent').tolist()
+        present_days = present.astype(int).tolist()
+        absent_days = (~present).astype(int).tolist()
+        ot_hours = np.where(present & (idx % 5 == 0), 2, 0).tolist()
+        late_minutes = np.where(present & (idx % 7 == 0), 15, 0).tolist()
         
-        print(f"📤 Uploading attendance for {len(attendance_records)} employees...")
-        start_time = time.time()
+        attendance_records = [
+            AttendanceRecord(
+                employee_id=emp['employee_id'],
+                name=emp['name'],
+                department=emp.get('department', 'Unknown'),
+                date=self.test_date,
+                status=status,
+                present_days=present_day,
+                absent_days=absent_day,
+                ot_hours=ot,
+                late_minutes=late
+            )
+            for emp, status, present_day, absent_day, ot, late in zip(
+                employees, statuses, present_days, absent_days, ot_hours, late_minutes
+            )
+        ]
         
-        response = self.session.post(f"{self.base_url}/api/bulk-update-attendance/", json=payload)
+        batch_size = self.upload_batch_size
+        batches = [attendance_records[i:i + batch_size] for i in range(0, len(attendance_records), batch_size)]
         
-        upload_time = time.time() - start_time
+        print(f"📤 Uploading attendance for {len(attendance_records)} employees in {len(batches)} request(s) of up to {batch_size}...")
+        totals = {'total_processed': 0, 'created_count': 0, 'updated_count': 0}
+        upload_time = 0.0
+        data = None
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ BULK UPLOAD SUCCESS!")
-            print(f"⚡ Response time: {upload_time:.3f}s")
-            print(f"📊 Records processed: {data.get('attendance_upload', {}).get('total_processed', 0)}")
-            print(f"🔄 Created: {data.get('attendance_upload', {}).get('created_count', 0)}")
-            print(f"✏️  Updated: {data.get('attendance_upload', {}).get('updated_count', 0)}")
-            print(f"⏱️  Processing time: {data.get('performance', {}).get('processing_time', 'N/A')}")
-            print(f"💾 DB operation time: {data.get('performance', {}).get('db_operation_time', 'N/A')}")
+        for batch_number, batch in enumerate(batches, start=1):
+            payload = {
+                'date': self.test_date,
+                'attendance_records': batch
+            }
+            start_time = time.time()
+            # orjson encodes straight to bytes, much faster than json= on large slabs
+            response = self.session.post(
+                f"{self.base_url}/api/bulk-update-attendance/",
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'}
+            )
+            batch_time = time.time() - start_time
+            upload_time += batch_time
             
-            # Check if it's truly lightning fast
-            if upload_time <= 3.0:
-                print(f"🎯 PERFORMANCE TARGET MET: Upload completed in {upload_time:.3f}s (≤ 3.0s)")
-            else:
-                print(f"⚠️  PERFORMANCE WARNING: Upload took {upload_time:.3f}s (> 3.0s target)")
+            if response.status_code != 200:
+                print(f"❌ BULK UPLOAD FAILED on batch {batch_number}/{len(batches)}: {response.status_code}")
+                print(f"Error: {response.text}")
+                return False, None
             
-            return True, data
+            data = orjson.loads(response.content)
+            for key in totals:
+                totals[key] += data.get('attendance_upload', {}).get(key, 0)
+            print(f"   📦 Batch {batch_number}/{len(batches)}: {len(batch)} records in {batch_time:.3f}s "
+                  f"({len(batch) / batch_time:.0f} rec/s)")
+        
+        print(f"✅ BULK UPLOAD SUCCESS!")
+        print(f"⚡ Response time: {upload_time:.3f}s")
+        if upload_time:
+            print(f"🔥 Throughput: {len(attendance_records) / upload_time:.0f} records/s")
+        print(f"📊 Records processed: {totals['total_processed']}")
+        print(f"🔄 Created: {totals['created_count']}")
+        print(f"✏️  Updated: {totals['updated_count']}")
+        if data:
+            print(f"⏱️  Processing time (last batch): {data.get('performance', {}).get('processing_time', 'N/A')}")
+            print(f"💾 DB operation time (last batch): {data.get('performance', {}).get('db_operation_time', 'N/A')}")
+        
+        # Check if it's truly lightning fast
+        if upload_time <= 3.0:
+            print(f"🎯 PERFORMANCE TARGET MET: Upload completed in {upload_time:.3f}s (≤ 3.0s)")
         else:
-            print(f"❌ BULK UPLOAD FAILED: {response.status_code}")
-            print(f"Error: {response.text}")
-            return False, None
+            print(f"⚠️  PERFORMANCE WARNING: Upload took {upload_time:.3f}s (> 3.0s target)")
+        
+        return True, {'attendance_upload': totals, 'upload_time': upload_time}
     
     def test_async_summary_update(self, employees):
         """Test the async monthly summary update"""
@@ -176,7 +229,7 @@ class AsyncBulkAttendanceTest:
         cache_keys_to_check = [
             f"attendance_all_records_{self.tenant_id}",
             f"monthly_attendance_summary_{self.tenant_id}",
-            f"dashboard_stats_{self.tenant_id}",
+            dashboard_stats_cache_key(self.tenant_id),
             f"payroll_overview_{self.tenant_id}"
         ]
         
@@ -10,6 +10,7 @@ def ultra_fast_process_summaries_background(tenant, attendance_date, employee_id
     from django.db import transaction
     from django.db.models import Count, Sum, Case, When, FloatField, IntegerField, Value
     from excel_data.models import MonthlyAttendanceSummary, DailyAttendance
+    from excel_data.services.cache_service import dashboard_stats_cache_key
     
     try:
         thread_start = time.time()
@@ -176,7 +177,7 @@ def ultra_fast_process_summaries_background(tenant, attendance_date, employee_id
                 f"monthly_attendance_summary_{tenant.id}_{attendance_date.year}_{attendance_date.month}",
                 f"monthly_attendance_summary_{tenant.id}",
                 f"attendance_tracker_{tenant.id}",
-                f"dashboard_stats_{tenant.id}",
+                dashboard_stats_cache_key(tenant.id),
                 f"attendance_all_records_{tenant.id}",
                 f"frontend_charts_{tenant.id}",
                 # CRITICAL: Clear all daily attendance all_records cache variations with param signatures
@@ -90,11 +90,16 @@ def upload_monthly_attendance():
             print("📤 Uploading monthly attendance data...")
             upload_response = requests.post(upload_url, json=monthly_data, headers=headers)
             
-            if upload_response.status_code in [200, 201]:
+            if upload_response.status_code == 202:
+                result = upload_response.json()
+                print(f"✅ Upload queued as job {result.get('job_id')} - poll /api/jobs/{result.get('job_id')}/ for the outcome")
+                return True
+            elif upload_response.status_code in [200, 201]:
                 result = upload_response.json()
                 print(f"✅ Upload successful!")
                 print(f"📊 Records processed: {result.get('total_records', 'N/A')}")
                 print(f"✅ Successfully created: {result.get('created', 'N/A')}")
+                print(f"🔄 Updated: {result.get('updated', 'N/A')}")
                 print(f"⚠️ Failed: {result.get('failed', 'N/A')}")
                 if result.get('errors'):
                     print(f"❌ Errors: {result['errors'][:5]}")  # Show first 5 errors
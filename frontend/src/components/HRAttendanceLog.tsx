@@ -203,13 +203,13 @@ const HRAttendanceLog: React.FC = () => {
 
       // STEP 2: Auto-trigger background loading if there are more employees
       if (initialData.progressive_loading?.has_more && initialData.progressive_loading?.auto_trigger_remaining) {
-        const remainingCount = initialData.progressive_loading.remaining_employees;
-        console.log(`🔄 Auto-triggering background load for ${remainingCount} remaining employees...`);
+        console.log('🔄 Auto-triggering background load for remaining employees...');
 
         // Add recommended delay before background load
         const delay = initialData.progressive_loading.recommended_delay_ms || 100;
+        const nextCursor = initialData.progressive_loading.next_cursor;
         setTimeout(async () => {
-          await loadRemainingEmployees(selectedDate, dayName, firstBatch, signal);
+          await loadRemainingEmployees(selectedDate, dayName, firstBatch, signal, nextCursor);
         }, delay);
       } else {
         // Cache the complete data if no more employees
@@ -237,11 +237,12 @@ const HRAttendanceLog: React.FC = () => {
   };
 
   // STEP 2: Load remaining employees in background
-  const loadRemainingEmployees = async (date: string, dayName: string, initialEmployees: Employee[], signal?: AbortSignal) => {
+  const loadRemainingEmployees = async (date: string, dayName: string, initialEmployees: Employee[], signal?: AbortSignal, cursor?: string) => {
     try {
       console.log(`📋 API Call 2: Background loading remaining employees for ${date}...`);
 
-      const remainingResponse = await apiCall(`/api/eligible-employees/?date=${date}&remaining=true`, {
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const remainingResponse = await apiCall(`/api/eligible-employees/?date=${date}&remaining=true${cursorParam}`, {
         signal
       });
 
@@ -54,6 +54,7 @@ const SimplePayrollCalculator: React.FC = () => {
   const [summary, setSummary] = useState<PayrollSummary | null>(null);
   const [loading, setLoading] = useState(false);
   const [calculating, setCalculating] = useState(false);
+  const [saving, setSaving] = useState(false);
   const [editingEntry, setEditingEntry] = useState<string | null>(null);
   const [editValues, setEditValues] = useState<{[key: string]: string | number}>({});
   const [showAdvanceModal, setShowAdvanceModal] = useState(false);
@@ -219,6 +220,24 @@ const SimplePayrollCalculator: React.FC = () => {
         setEditValues({});
   };
 
+  // Large payrolls are saved by a background job; poll it until it finishes
+  const waitForPayrollJob = async (jobId: number) => {
+    const pollIntervalMs = 2000;
+    const maxAttempts = 150; // ~5 minutes
+    for (let attempt = 0; attempt < maxAttempts; attempt++) {
+      await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+      const response = await apiCall(`/api/jobs/${jobId}/`);
+      if (!response.ok) {
+        throw new Error(`Failed to fetch job status (HTTP ${response.status})`);
+      }
+      const job = await response.json();
+      if (job.status === 'SUCCESS' || job.status === 'FAILED') {
+        return job;
+      }
+    }
+    throw new Error('Timed out waiting for the payroll save to finish');
+  };
+
   const savePayrollPeriod = async () => {
     try {
       if (!selectedPeriod) {
@@ -253,6 +272,8 @@ const SimplePayrollCalculator: React.FC = () => {
         }))
       };
 
+      setSaving(true);
+
       // Use the new direct save endpoint (no recalculation)
       const response = await apiCall('/api/save-payroll-period-direct/', {
         method: 'POST',
@@ -262,7 +283,20 @@ const SimplePayrollCalculator: React.FC = () => {
         body: JSON.stringify(payrollPeriodData)
       });
 
-      if (response.ok) {
+      if (response.status === 202) {
+        // Queued: nothing is written until the job succeeds
+        const queued = await response.json();
+        const job = await waitForPayrollJob(queued.job_id);
+        if (job.status === 'FAILED') {
+          alert(`Failed to save payroll period: ${job.error || 'Unknown error'}`);
+          return;
+        }
+        const savedCount = job.result?.saved_entries || payrollData.length || 0;
+        alert(`Payroll period saved successfully! Saved ${savedCount} salary calculations as displayed.`);
+
+        clearSalaryDataCache();
+        window.location.href = '/hr-management/payroll-overview';
+      } else if (response.ok) {
         const result = await response.json();
         const savedCount = result.saved_entries || payrollData.length || 0;
         alert(`Payroll period saved successfully! Saved ${savedCount} salary calculations as displayed.`);
@@ -279,6 +313,8 @@ const SimplePayrollCalculator: React.FC = () => {
     } catch (error) {
       console.error('Error saving payroll period:', error);
       alert('Error saving payroll period. Please try again.');
+    } finally {
+      setSaving(false);
     }
   };
 
@@ -437,10 +473,11 @@ const SimplePayrollCalculator: React.FC = () => {
               </button>
               <button
                 onClick={savePayrollPeriod}
-                className="flex items-center gap-2 px-4 py-2 bg-teal-600 text-white rounded-lg hover:bg-teal-700"
+                disabled={saving}
+                className="flex items-center gap-2 px-4 py-2 bg-teal-600 text-white rounded-lg hover:bg-teal-700 disabled:bg-gray-400 disabled:cursor-not-allowed"
               >
-                <CheckCircle size={16} />
-                Save 
+                {saving ? <Loader2 size={16} className="animate-spin" /> : <CheckCircle size={16} />}
+                {saving ? 'Saving...' : 'Save'}
               </button>
             </div>
           </div>